@@ -8,13 +8,20 @@ import os
 import sys
 import time
 import subprocess
-import shutil
 import json
 import socket
+import struct
+import selectors
+import errno
+import fcntl
 import threading
 import ipaddress
 import csv
+import io
 import re
+from operator import itemgetter
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from rich.console import Console
@@ -25,106 +32,365 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeEl
 from rich.table import Table
 from rich import print as rprint
 
+# Optional: faster JSON encoding for saved results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: netlink access for interface up/down without spawning ip link
+try:
+    from pyroute2 import IPRoute
+except ImportError:
+    IPRoute = None
+
+# Optional: inotify wakeups for the live airodump-ng CSV instead of fixed-interval polling
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+# Optional: in-process DNS resolution for DNS reconnaissance instead of spawning dig
+try:
+    import dns.message
+    import dns.query
+    import dns.resolver
+    import dns.reversename
+except ImportError:
+    dns = None
+
 # Initialize Rich console for colored output
 console = Console()
 
+# Concurrent probes used by the ping sweep
+_PING_SWEEP_WORKERS = 128
+
+# TCP connect fallback when nmap is unavailable: ports probed, concurrency and time limits
+_FALLBACK_SCAN_PORTS = (21, 22, 23, 25, 53, 80, 110, 135, 139, 143, 443, 445, 515, 554, 631,
+                        993, 995, 1900, 3306, 3389, 5000, 5555, 5900, 8080, 9100)
+_CONNECT_SCAN_CONCURRENCY = 512
+_CONNECT_SCAN_TIMEOUT = 0.5
+_BANNER_GRAB_TIMEOUT = 1.0
+
+# Ports tried by the TCP liveness probe when no ICMP socket can be opened
+_TCP_PING_PORTS = (22, 80, 443)
+
+# Interface address/netmask ioctls (linux/sockios.h)
+_SIOCGIFADDR = 0x8915
+_SIOCGIFNETMASK = 0x891B
+
+# External tools NetHawk drives, mapped to the package that provides each
+_REQUIRED_TOOLS = {
+    "airodump-ng": "aircrack-ng",
+    "aireplay-ng": "aircrack-ng",
+    "aircrack-ng": "aircrack-ng",
+    "iw": "iw",
+    "ip": "iproute2",
+    "nmap": "nmap",
+    "ping": "iputils-ping",
+    "masscan": "masscan",
+    "nikto": "nikto",
+    "gobuster": "gobuster",
+    "enum4linux": "enum4linux",
+    "smbclient": "samba-client",
+    "dig": "dnsutils",
+    "nslookup": "dnsutils"
+}
+
+# Valid main menu selections
+_MENU_CHOICES = frozenset("1234567890")
+
+# Fixed airodump-ng options for the passive scan; the CSV is rewritten every 5s rather than
+# every second since the live count refreshes at that pace anyway
+_AIRODUMP_BASE_ARGS = ("airodump-ng", "--output-format", "csv", "--write-interval", "5",
+                       "--manufacturer", "--uptime", "--wps", "--beacons", "--ivs")
+
+# Access point rows (leading BSSID) in the airodump-ng CSV
+_AP_ROW_RE = re.compile(rb'^(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}', re.MULTILINE)
+
+# airodump-ng CSV columns kept for the results display, as (keys, row field getter)
+_AP_KEYS = ("BSSID", "ESSID", "Channel", "Power", "Privacy", "Cipher", "Auth", "Beacons", "Data")
+_AP_FIELDS = itemgetter(0, 13, 3, 8, 5, 6, 7, 9, 10)
+_CLIENT_KEYS = ("Station", "Power", "BSSID")
+_CLIENT_FIELDS = itemgetter(0, 3, 5)
+
+# Results table layouts: (header, style) per column, and the dict fields shown in them
+_AP_TABLE_COLUMNS = (("BSSID", "cyan"), ("ESSID", "green"), ("Channel", "yellow"), ("Power", "red"),
+                     ("Privacy", "magenta"), ("WPS", "blue"), ("Beacons", "white"))
+_AP_TABLE_ROW = itemgetter("BSSID", "ESSID", "Channel", "Power", "Privacy", "WPS", "Beacons")
+_CLIENT_TABLE_COLUMNS = (("Station MAC", "cyan"), ("Power", "red"), ("Connected BSSID", "green"),
+                         ("Probed ESSIDs", "yellow"))
+_CLIENT_TABLE_ROW = itemgetter("Station", "Power", "BSSID", "Probed")
+_HOSTS_TABLE_COLUMNS = (("IP Address", "cyan"), ("Status", "green"), ("MAC Address", "yellow"),
+                        ("Device Type", "magenta"), ("OS", "blue"), ("Open Ports", "red"))
+
+# LLC/SNAP header of an EAPOL (802.1X, ethertype 0x888E) frame in an 802.11 capture
+_EAPOL_LLC_SNAP = b"\xaa\xaa\x03\x00\x00\x00\x88\x8e"
+
+# pcap link types airodump-ng writes: bare 802.11, or 802.11 behind a radiotap header
+_LINKTYPE_IEEE802_11 = 105
+_LINKTYPE_RADIOTAP = 127
+
+# EAPOL-Key Key Information bits that tell the 4-way handshake messages apart
+_KEY_INFO_ACK = 0x0080
+_KEY_INFO_MIC = 0x0100
+_KEY_INFO_SECURE = 0x0200
+
+# Interface names in `iw dev` output
+_IFACE_RE = re.compile(r'^\s*Interface\s+(\S+)', re.MULTILINE)
+
+# BSSID format XX:XX:XX:XX:XX:XX (or dash separated), checked byte by byte
+_HEX_DIGITS = frozenset(b'0123456789abcdefABCDEF')
+_BSSID_SEPARATORS = frozenset(b':-')
+_BSSID_HEX_POSITIONS = (0, 1, 3, 4, 6, 7, 9, 10, 12, 13, 15, 16)
+
+# Progress lines nmap adds to its XML output with --stats-every
+_NMAP_TASKPROGRESS_RE = re.compile(r'<taskprogress task="([^"]*)"[^>]*percent="([\d.]+)"')
+
+# Question line of a dig response (";example.com.  IN  MX"), giving the queried record type
+_DIG_QUESTION_RE = re.compile(r'^;\S+\s+IN\s+(\S+)\s*$', re.MULTILINE)
+
+# First IPv4 address in an A record answer line
+_DIG_A_RECORD_RE = re.compile(r'\sIN\s+A\s+(\d{1,3}(?:\.\d{1,3}){3})\s*$', re.MULTILINE)
+
+# CVE identifiers in vulnerability titles
+_CVE_RE = re.compile(r'CVE-\d{4}-\d+')
+
+# Keywords that mark a "+ ..." nikto line as a finding
+_NIKTO_FINDING_RE = re.compile(r'vulnerable|risk|header|directory|file', re.IGNORECASE)
+
+# Severity keywords for nmap vuln titles and nikto findings, most severe level first
+_NMAP_SEVERITY_PATTERNS = (
+    ("Critical", re.compile(r'critical|remote code execution|rce', re.IGNORECASE)),
+    ("High", re.compile(r'high|buffer overflow|sql injection', re.IGNORECASE)),
+    ("Medium", re.compile(r'medium|information disclosure', re.IGNORECASE)),
+    ("Low", re.compile(r'low|info', re.IGNORECASE)),
+)
+_NIKTO_SEVERITY_PATTERNS = (
+    ("Critical", re.compile(r'critical|remote code execution|rce|sql injection|buffer overflow', re.IGNORECASE)),
+    ("High", re.compile(r'high|xss|cross-site|directory traversal|file upload', re.IGNORECASE)),
+    ("Medium", re.compile(r'medium|information disclosure|header|version disclosure', re.IGNORECASE)),
+    ("Low", re.compile(r'low|info|default|directory|file', re.IGNORECASE)),
+)
+
+# Local OUI vendor databases (IEEE oui.txt or nmap's prefix list), first readable one wins
+_OUI_VENDOR_FILES = ("/usr/share/ieee-data/oui.txt", "/var/lib/ieee-data/oui.txt",
+                     "/usr/share/nmap/nmap-mac-prefixes")
+
+# Common OUI prefixes for device types, checked in order (first match wins)
+_OUI_DEVICE_TYPES = (
+    ("Apple Device (iPhone/iPad/Mac)", frozenset(["001B63", "001C42", "002312", "002500", "002608", "040CCE", "045453", "087402", "0C74C2", "1093E9", "14109F", "186590", "1C1B0D", "1C36BB", "1CABA7", "20C9D0", "24A074", "283737", "28CFDA", "2C337A", "2CB43A", "3090AB", "34159E", "34A395", "38C986", "3C0754", "3C2EF9", "3CA82A", "40331A", "40A6D9", "442A60", "48A6D9", "4C3275", "4C57CA", "4C8D79", "50EAD6", "54724F", "58B035", "5C5948", "5C95AE", "600308", "60334B", "60C547", "60FACD", "64B9E8", "680927", "685B35", "68967B", "68D93C", "6C198F", "6C4008", "6C72E7", "6C9466", "701124", "70480F", "705681", "70CD60", "70DEE2", "74E2F5", "7831C1", "784F43", "78CA39", "7C04D0", "7C6D62", "7CD1C3", "800655", "80BE05", "80E650", "843835", "84B153", "8863DF", "88DEA9", "8C2DAA", "8C5877", "8C8590", "8CFABA", "9027E4", "90840D", "90A4DE", "90B931", "94E6F7", "9803D8", "98CA33", "9C04EB", "9C207B", "9C84BF", "9C8E99", "A0999B", "A0D795", "A45E60", "A4B197", "A4C361", "A860B6", "A8968A", "A8BBCF", "A8F751", "AC1F74", "AC3C0B", "AC61EA", "AC87A3", "ACDE48", "B065BD", "B09FBA", "B418D1", "B4527E", "B4F0AB", "B8098A", "B817C2", "B853AC", "B8782E", "B8C75D", "B8E856", "B8F6B1", "BC52B7", "BC671C", "BC926B", "BCEC5D", "C0255C", "C06394", "C0CECD", "C42C03", "C48466", "C4B301", "C82A14", "C869CD", "C8BCC8", "C8E0EB", "CC08E0", "CC25EF", "CC29F5", "CC785F", "D0034B", "D023DB", "D0A637", "D49A20", "D4D252", "D83062", "D89695", "D8A25E", "D8CF9C", "DC2B2A", "DC3745", "DC56E7", "DCA904", "E0ACCB", "E425E7", "E48D8C", "E4B318", "E4C63D", "E84040", "E8802E", "E8B2AC", "E8D03C", "EC3586", "EC89F5", "ECADB8", "F01898", "F02475", "F04F7C", "F07959", "F0DBE2", "F40F24", "F431C3", "F45C89", "F45EAB", "F46D04", "F48E38", "F49F54", "F4CB52", "F4D488", "F81EDF", "F81654", "F82FA8", "F84D89", "F866F2", "F88E85", "F896EA", "FC253F", "FC64BA", "FC94CE", "FCDBB3", "FCE998"])),
+    ("Samsung Device (Phone/TV/Tablet)", frozenset(["001599", "00166B", "0017C9", "001839", "001A8A", "001B98", "001C43", "001D7E", "001E75", "001F5B", "00214C", "002258", "002339", "002454", "002566", "00265D", "002719", "00280F", "002915", "002A5A", "002B67", "002C44", "002D76", "002EC8", "002F3A", "00304D", "003146", "003221", "003350", "0034DA", "00351F", "003676", "00376D", "0038BC", "00390F", "003A99", "003B9F", "003CF0", "003D41", "003E01", "003F0E", "004045", "0041B4", "00425A", "004385", "004437", "00455E", "004668", "00474F", "00487A", "004955", "004A30", "004BED", "004CC1", "004D32", "004E01", "004F62", "005043", "00515E", "005218", "005332", "0054AF", "0055DA", "00562B", "00578C", "005844", "0059AC", "005A13", "005B94", "005C0C", "005D73", "005E0C", "005F86", "006057", "006171", "00620E", "006373", "0064B6", "006583", "00664A", "006742", "0068EB", "0069AB", "006A39", "006B8D", "006CBC", "006D52", "006EFD", "006F20", "00704D", "0071C2", "00722D", "007349", "00749C", "00756D", "00764E", "007750", "0078CD", "00797B", "007A3D", "007B8B", "007C2D", "007D60", "007E4C", "007F12", "008096", "0081F4", "008250", "00835F", "008438", "008525", "0086CE", "008701", "008865", "00894F", "008A96", "008BAD", "008C54", "008D4E", "008EFD", "008F59", "00904C", "009127", "00924A", "0093FB", "0094A6", "00958E", "00964B", "009727", "00988C", "00994C", "009ACD", "009B8B", "009C02", "009D6B", "009E1C", "009F7B", "00A04A", "00A18C", "00A2EE", "00A38E", "00A45A", "00A58C", "00A650", "00A78C", "00A896", "00A94A", "00AA70", "00AB00", "00AC29", "00AD24", "00AEFA", "00AF1B", "00B04A", "00B18C", "00B24A", "00B38C", "00B44A", "00B58C", "00B64A", "00B78C", "00B84A", "00B98C", "00BA4A", "00BB8C", "00BC4A", "00BD8C", "00BE4A", "00BF8C", "00C04A", "00C18C", "00C24A", "00C38C", "00C44A", "00C58C", "00C64A", "00C78C", "00C84A", "00C98C", "00CA4A", "00CB8C", "00CC4A", "00CD8C", "00CE4A", "00CF8C", "00D04A", "00D18C", "00D24A", "00D38C", "00D44A", "00D58C", "00D64A", "00D78C", "00D84A", "00D98C", "00DA4A", "00DB8C", "00DC4A", "00DD8C", "00DE4A", "00DF8C", "00E04A", "00E18C", "00E24A", "00E38C", "00E44A", "00E58C", "00E64A", "00E78C", "00E84A", "00E98C", "00EA4A", "00EB8C", "00EC4A", "00ED8C", "00EE4A", "00EF8C", "00F04A", "00F18C", "00F24A", "00F38C", "00F44A", "00F58C", "00F64A", "00F78C", "00F84A", "00F98C", "00FA4A", "00FB8C", "00FC4A", "00FD8C", "00FE4A", "00FF8C"])),
+    ("Google Device (Pixel/Nest/Chromecast)", frozenset(["001A11", "001B44", "001C42", "001D0F", "001E06", "001F5B", "002078", "00216A", "002258", "002312", "002401", "002500", "002608", "002719", "00280F", "002915", "002A5A", "002B67", "002C44", "002D76", "002EC8", "002F3A", "00304D", "003146", "003221", "003350", "0034DA", "00351F", "003676", "00376D", "0038BC", "00390F", "003A99", "003B9F", "003CF0", "003D41", "003E01", "003F0E", "004045", "0041B4", "00425A", "004385", "004437", "00455E", "004668", "00474F", "00487A", "004955", "004A30", "004BED", "004CC1", "004D32", "004E01", "004F62", "005043", "00515E", "005218", "005332", "0054AF", "0055DA", "00562B", "00578C", "005844", "0059AC", "005A13", "005B94", "005C0C", "005D73", "005E0C", "005F86", "006057", "006171", "00620E", "006373", "0064B6", "006583", "00664A", "006742", "0068EB", "0069AB", "006A39", "006B8D", "006CBC", "006D52", "006EFD", "006F20", "00704D", "0071C2", "00722D", "007349", "00749C", "00756D", "00764E", "007750", "0078CD", "00797B", "007A3D", "007B8B", "007C2D", "007D60", "007E4C", "007F12", "008096", "0081F4", "008250", "00835F", "008438", "008525", "0086CE", "008701", "008865", "00894F", "008A96", "008BAD", "008C54", "008D4E", "008EFD", "008F59", "00904C", "009127", "00924A", "0093FB", "0094A6", "00958E", "00964B", "009727", "00988C", "00994C", "009ACD", "009B8B", "009C02", "009D6B", "009E1C", "009F7B", "00A04A", "00A18C", "00A2EE", "00A38E", "00A45A", "00A58C", "00A650", "00A78C", "00A896", "00A94A", "00AA70", "00AB00", "00AC29", "00AD24", "00AEFA", "00AF1B", "00B04A", "00B18C", "00B24A", "00B38C", "00B44A", "00B58C", "00B64A", "00B78C", "00B84A", "00B98C", "00BA4A", "00BB8C", "00BC4A", "00BD8C", "00BE4A", "00BF8C", "00C04A", "00C18C", "00C24A", "00C38C", "00C44A", "00C58C", "00C64A", "00C78C", "00C84A", "00C98C", "00CA4A", "00CB8C", "00CC4A", "00CD8C", "00CE4A", "00CF8C", "00D04A", "00D18C", "00D24A", "00D38C", "00D44A", "00D58C", "00D64A", "00D78C", "00D84A", "00D98C", "00DA4A", "00DB8C", "00DC4A", "00DD8C", "00DE4A", "00DF8C", "00E04A", "00E18C", "00E24A", "00E38C", "00E44A", "00E58C", "00E64A", "00E78C", "00E84A", "00E98C", "00EA4A", "00EB8C", "00EC4A", "00ED8C", "00EE4A", "00EF8C", "00F04A", "00F18C", "00F24A", "00F38C", "00F44A", "00F58C", "00F64A", "00F78C", "00F84A", "00F98C", "00FA4A", "00FB8C", "00FC4A", "00FD8C", "00FE4A", "00FF8C"])),
+    ("Router/Network Device", frozenset(["005056", "000C29", "001C42", "001D7E", "001E75", "001F5B", "002078", "00216A", "002258", "002312", "002401", "002500", "002608", "002719", "00280F", "002915", "002A5A", "002B67", "002C44", "002D76", "002EC8", "002F3A", "00304D", "003146", "003221", "003350", "0034DA", "00351F", "003676", "00376D", "0038BC", "00390F", "003A99", "003B9F", "003CF0", "003D41", "003E01", "003F0E", "004045", "0041B4", "00425A", "004385", "004437", "00455E", "004668", "00474F", "00487A", "004955", "004A30", "004BED", "004CC1", "004D32", "004E01", "004F62", "005043", "00515E", "005218", "005332", "0054AF", "0055DA", "00562B", "00578C", "005844", "0059AC", "005A13", "005B94", "005C0C", "005D73", "005E0C", "005F86", "006057", "006171", "00620E", "006373", "0064B6", "006583", "00664A", "006742", "0068EB", "0069AB", "006A39", "006B8D", "006CBC", "006D52", "006EFD", "006F20", "00704D", "0071C2", "00722D", "007349", "00749C", "00756D", "00764E", "007750", "0078CD", "00797B", "007A3D", "007B8B", "007C2D", "007D60", "007E4C", "007F12", "008096", "0081F4", "008250", "00835F", "008438", "008525", "0086CE", "008701", "008865", "00894F", "008A96", "008BAD", "008C54", "008D4E", "008EFD", "008F59", "00904C", "009127", "00924A", "0093FB", "0094A6", "00958E", "00964B", "009727", "00988C", "00994C", "009ACD", "009B8B", "009C02", "009D6B", "009E1C", "009F7B", "00A04A", "00A18C", "00A2EE", "00A38E", "00A45A", "00A58C", "00A650", "00A78C", "00A896", "00A94A", "00AA70", "00AB00", "00AC29", "00AD24", "00AEFA", "00AF1B", "00B04A", "00B18C", "00B24A", "00B38C", "00B44A", "00B58C", "00B64A", "00B78C", "00B84A", "00B98C", "00BA4A", "00BB8C", "00BC4A", "00BD8C", "00BE4A", "00BF8C", "00C04A", "00C18C", "00C24A", "00C38C", "00C44A", "00C58C", "00C64A", "00C78C", "00C84A", "00C98C", "00CA4A", "00CB8C", "00CC4A", "00CD8C", "00CE4A", "00CF8C", "00D04A", "00D18C", "00D24A", "00D38C", "00D44A", "00D58C", "00D64A", "00D78C", "00D84A", "00D98C", "00DA4A", "00DB8C", "00DC4A", "00DD8C", "00DE4A", "00DF8C", "00E04A", "00E18C", "00E24A", "00E38C", "00E44A", "00E58C", "00E64A", "00E78C", "00E84A", "00E98C", "00EA4A", "00EB8C", "00EC4A", "00ED8C", "00EE4A", "00EF8C", "00F04A", "00F18C", "00F24A", "00F38C", "00F44A", "00F58C", "00F64A", "00F78C", "00F84A", "00F98C", "00FA4A", "00FB8C", "00FC4A", "00FD8C", "00FE4A", "00FF8C"])),
+)
+
+
+# Flat OUI -> device type index; built in reverse so earlier groups win on overlap
+_OUI_INDEX = {oui: device_type
+              for device_type, prefixes in reversed(_OUI_DEVICE_TYPES)
+              for oui in prefixes}
+
+
+def _eapol_key_message(frame, linktype):
+    """Classify a captured 802.11 frame as a 4-way handshake message.
+    
+    Returns (BSSID, station MAC, message number 1-4, replay counter), or None for any other frame.
+    """
+    if linktype == _LINKTYPE_RADIOTAP:
+        if len(frame) < 4:
+            return None
+        frame = frame[struct.unpack_from('<H', frame, 2)[0]:]
+    elif linktype != _LINKTYPE_IEEE802_11:
+        return None
+    if len(frame) < 24:
+        return None
+    
+    # Unprotected data frames only; the DS bits say which address is the AP
+    fc0, fc1 = frame[0], frame[1]
+    if (fc0 >> 2) & 3 != 2 or fc1 & 0x40:
+        return None
+    ds = fc1 & 3
+    if ds == 1:
+        bssid, station = frame[4:10], frame[10:16]
+    elif ds == 2:
+        station, bssid = frame[4:10], frame[10:16]
+    else:
+        return None
+    header_len = 24
+    if fc0 & 0x80:  # QoS data, plus HT control when the order bit is set
+        header_len += 6 if fc1 & 0x80 else 2
+    
+    # LLC/SNAP, EAPOL header (type 3 = Key), then key descriptor, key info, key length,
+    # replay counter and nonce
+    body = frame[header_len:]
+    if len(body) < 57 or body[:8] != _EAPOL_LLC_SNAP or body[9] != 3:
+        return None
+    key_info = struct.unpack_from('>H', body, 13)[0]
+    if key_info & _KEY_INFO_ACK:
+        message = 3 if key_info & _KEY_INFO_MIC else 1
+    elif key_info & _KEY_INFO_MIC:
+        # M4 is marked secure (WPA2) or carries no nonce (WPA1)
+        message = 4 if key_info & _KEY_INFO_SECURE or not any(body[25:57]) else 2
+    else:
+        return None
+    return bytes(bssid), bytes(station), message, int.from_bytes(body[17:25], 'big')
+
+
+def _oui_device_type(oui):
+    """Resolve a 6-character OUI to a device type with a single dict lookup."""
+    return _OUI_INDEX.get(oui, "Unknown Device")
+
+
+def _host_ips(network, limit=None):
+    """Host addresses of an IPv4Network as strings, in order, like network.hosts().
+    
+    Walks the integer range directly instead of creating an IPv4Address per host.
+    """
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+    if network.prefixlen < 31:  # /31 and /32 have no network/broadcast address to skip
+        first += 1
+        last -= 1
+    if limit is not None:
+        last = min(last, first + limit - 1)
+    pack = struct.Struct("!I").pack
+    return [socket.inet_ntoa(pack(n)) for n in range(first, last + 1)]
+
+
+def _make_table(title, columns):
+    """Create a Rich table with the given (header, style) columns."""
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+def _icmp_checksum(data):
+    """Internet checksum (RFC 1071) of an ICMP message."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _classify_severity(title, patterns):
+    """Return the first severity level whose keyword pattern occurs in the title."""
+    for severity, pattern in patterns:
+        if pattern.search(title):
+            return severity
+    return "Unknown"
+
 class NetHawk:
     """NetHawk application - Professional reconnaissance capabilities."""
     
+    # OUI -> vendor name, loaded once from _OUI_VENDOR_FILES
+    _oui_vendors = None
+    
+    # Executable names found on $PATH, scanned once by _check_tools
+    _path_executables = None
+    
+    # TCP port -> service name, filled as ports are looked up in the services database
+    _tcp_service_names = {}
+    
     def __init__(self):
         """Initialize NetHawk with session management."""
         self.config = self._load_config()
         self.session_number = self._get_next_session_number()
-        self.session_path = os.path.abspath(f"sessions/session_{self.session_number}")
-        self.handshakes_path = os.path.join(self.session_path, "handshakes")
-        self.logs_path = os.path.join(self.session_path, "logs")
-        self.vulns_path = os.path.join(self.session_path, "vulnerabilities")
-        self.reports_path = os.path.join(self.session_path, "reports")
+        self.session_path = Path("sessions", f"session_{self.session_number}").absolute()
+        self.handshakes_path = self.session_path / "handshakes"
+        self.logs_path = self.session_path / "logs"
+        self.vulns_path = self.session_path / "vulnerabilities"
+        self.reports_path = self.session_path / "reports"
         self._create_session_directories()
+        self._save_session_number()
+        
+        # Wireless interface caches, invalidated whenever an interface changes mode
+        self._iface_cache = None
+        self._iface_cache_time = 0.0
+        self._iw_info_cache = {}
+        
+        # Kernel ARP table {ip: mac}, re-read from /proc/net/arp on lookup misses
+        self._arp_cache = {}
+        
+        # Detected local network, cached until an interface changes mode
+        self._network_cache = None
         
         # Tool availability cache
         self.tools_available = {}
         self._check_tools()
     
     def _get_next_session_number(self):
-        """Get the next available session number."""
-        sessions_dir = "sessions"
-        if not os.path.exists(sessions_dir):
-            return 1
-        
-        existing_sessions = [d for d in os.listdir(sessions_dir) if d.startswith("session_")]
-        if not existing_sessions:
-            return 1
-        
-        # Extract numbers and find the highest
-        numbers = []
-        for session in existing_sessions:
-            try:
-                num = int(session.split("_")[1])
-                numbers.append(num)
-            except (IndexError, ValueError):
-                continue
+        """Get the next available session number from sessions/.counter.
         
-        return max(numbers) + 1 if numbers else 1
+        The counter holds the last session NetHawk created. Sessions added without it (older
+        versions, copied in by hand) are only noticed, via a directory scan, once the next
+        number collides with one of them.
+        """
+        sessions_dir = Path("sessions")
+        try:
+            number = int((sessions_dir / ".counter").read_text()) + 1
+        except (OSError, ValueError):
+            number = None
+        
+        # Bootstrap (or repair a stale counter) from a directory scan
+        if number is None or (sessions_dir / f"session_{number}").exists():
+            number = self._scan_session_numbers(sessions_dir) + 1
+        return number
+    
+    def _save_session_number(self):
+        """Record the current session in sessions/.counter once its directories exist."""
+        counter_file = self.session_path.parent / ".counter"
+        try:
+            tmp_file = counter_file.with_name(f".counter.{os.getpid()}")
+            tmp_file.write_text(str(self.session_number))
+            os.replace(tmp_file, counter_file)
+        except OSError:
+            pass  # Read-only sessions dir: the next start simply scans again
+    
+    def _scan_session_numbers(self, sessions_dir):
+        """Return the highest existing session_<N> number (0 if there are none)."""
+        try:
+            # Single directory pass; the highest session_<N> wins
+            with os.scandir(sessions_dir) as entries:
+                numbers = (int(entry.name[8:]) for entry in entries
+                           if entry.name.startswith("session_") and entry.name[8:].isdigit())
+                return max(numbers, default=0)
+        except FileNotFoundError:
+            return 0
     
     def _create_session_directories(self):
         """Create session directory structure."""
-        directories = [
-            self.session_path,
-            self.handshakes_path,
-            self.logs_path,
-            self.vulns_path,
-            self.reports_path
-        ]
-        
-        for directory in directories:
+        subdirectories = (self.handshakes_path, self.logs_path, self.vulns_path, self.reports_path)
+        
+        # parents=True creates the session directory itself along with the first subdirectory
+        for directory in subdirectories:
             try:
-                os.makedirs(directory, exist_ok=True)
-                console.print(f"[green]✓[/green] Created directory: {directory}")
-            except Exception as e:
+                directory.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
                 console.print(f"[red]✗[/red] Failed to create directory {directory}: {e}")
                 raise
+        
+        # Render all created paths in one panel instead of one print per directory
+        created = [f"[green]✓[/green] {directory}" for directory in (self.session_path, *subdirectories)]
+        console.print(Panel("\n".join(created), title="[bold green]Session Directories[/bold green]"))
     
     def _check_tools(self):
         """Check for required tools and cache results."""
-        required_tools = {
-            "airodump-ng": "aircrack-ng",
-            "aireplay-ng": "aircrack-ng", 
-            "aircrack-ng": "aircrack-ng",
-            "iw": "iw",
-            "ip": "iproute2",
-            "nmap": "nmap",
-            "ping": "iputils-ping",
-            "masscan": "masscan",
-            "nikto": "nikto",
-            "gobuster": "gobuster",
-            "enum4linux": "enum4linux",
-            "smbclient": "samba-client",
-            "dig": "dnsutils",
-            "nslookup": "dnsutils"
-        }
-        
         self.tools_available = {}
         missing_tools = []
         
-        # Show progress for tool checking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("Checking tools...", total=len(required_tools))
-            
-            for tool, package in required_tools.items():
-                progress.update(task, description=f"Checking {tool}...")
-                if shutil.which(tool):
-                    self.tools_available[tool] = True
-                else:
-                    self.tools_available[tool] = False
-                    missing_tools.append(f"{tool} (install: {package})")
-                progress.advance(task)
+        # Walk $PATH once per process and check every tool against the same snapshot
+        if NetHawk._path_executables is None:
+            NetHawk._path_executables = self._build_path_executables()
+        for tool, package in _REQUIRED_TOOLS.items():
+            if self._check_tool_exists(tool):
+                self.tools_available[tool] = True
+            else:
+                self.tools_available[tool] = False
+                missing_tools.append(f"{tool} (install: {package})")
         
         if missing_tools:
             console.print(f"[yellow]Missing tools: {', '.join(missing_tools)}[/yellow]")
@@ -133,6 +399,28 @@ class NetHawk:
         else:
             console.print("[green]✓ All required tools found![/green]")
     
+    def _build_path_executables(self):
+        """Scan every $PATH directory once and return the set of executable names."""
+        executables = set()
+        for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file() and os.access(entry.path, os.X_OK):
+                                executables.add(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return executables
+    
+    def _check_tool_exists(self, tool):
+        """Check a tool against the cached $PATH scan."""
+        return tool in NetHawk._path_executables
+    
     def display_logo(self):
         """Display NetHawk ASCII logo."""
         logo = r"""
@@ -201,27 +489,46 @@ class NetHawk:
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
     
-    def _get_wireless_interfaces(self):
-        """Get available wireless interfaces."""
+    def _get_wireless_interfaces(self, max_age=5.0):
+        """Get available wireless interfaces (cached for max_age seconds)."""
+        now = time.monotonic()
+        if self._iface_cache is not None and now - self._iface_cache_time < max_age:
+            return list(self._iface_cache)
+        
         interfaces = []
         try:
             # Use iw to list wireless interfaces
             result = subprocess.run(["iw", "dev"], capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'Interface' in line:
-                        iface = line.split()[-1]
-                        interfaces.append(iface)
+                interfaces = _IFACE_RE.findall(result.stdout)
         except Exception as e:
             console.print(f"[yellow]Warning: Could not detect interfaces with iw: {e}[/yellow]")
             # Fallback to common interface names
             common_interfaces = ['wlan0', 'wlan1', 'wlp2s0', 'wlp3s0']
-            for iface in common_interfaces:
-                if os.path.exists(f'/sys/class/net/{iface}'):
-                    interfaces.append(iface)
+            present = self._netdev_set()
+            interfaces.extend(iface for iface in common_interfaces if iface in present)
         
-        return interfaces
+        self._iface_cache = interfaces
+        self._iface_cache_time = now
+        return list(interfaces)
+    
+    def _netdev_set(self):
+        """Snapshot of the network device names currently in /sys/class/net."""
+        try:
+            return set(os.listdir('/sys/class/net'))
+        except OSError:
+            return set()
+    
+    def _iw_info(self, iface, ttl=2.0):
+        """Run `iw <iface> info`, reusing the result for ttl seconds."""
+        now = time.monotonic()
+        cached = self._iw_info_cache.get(iface)
+        if cached is not None and now - cached[1] < ttl:
+            return cached[0]
+        
+        result = subprocess.run(["iw", iface, "info"], capture_output=True, text=True, timeout=5)
+        self._iw_info_cache[iface] = (result, now)
+        return result
     
     def _check_monitor_mode_support(self, iface):
         """Check if interface supports monitor mode with better detection."""
@@ -229,7 +536,7 @@ class NetHawk:
             console.print(f"[blue]Checking monitor mode support for {iface}...[/blue]")
             
             # First check if interface exists and is wireless
-            result = subprocess.run(["iw", iface, "info"], capture_output=True, text=True, timeout=5)
+            result = self._iw_info(iface)
             if result.returncode != 0:
                 console.print(f"[yellow]Warning: Could not get info for {iface}[/yellow]")
                 console.print(f"[blue]Let's try anyway - airmon-ng will handle it[/blue]")
@@ -245,22 +552,6 @@ class NetHawk:
             if "monitor" in result.stdout.lower():
                 console.print(f"[green]✓ {iface} is already in monitor mode[/green]")
             return True
-    
-            # Try to set monitor mode to test if it's supported
-            console.print(f"[blue]Testing monitor mode capability...[/blue]")
-            test_result = subprocess.run(["iw", iface, "set", "type", "monitor"], 
-                                       capture_output=True, text=True, timeout=5)
-            
-            if test_result.returncode == 0:
-                console.print(f"[green]✓ {iface} supports monitor mode[/green]")
-                # Restore to managed mode
-                subprocess.run(["iw", iface, "set", "type", "managed"], 
-                             capture_output=True, timeout=5)
-                return True
-            else:
-                console.print(f"[yellow]Warning: Direct monitor mode test failed[/yellow]")
-                console.print(f"[blue]But airmon-ng might still work - let's try![/blue]")
-                return True  # Let airmon-ng handle it
                 
         except Exception as e:
             console.print(f"[yellow]Warning: Monitor mode check failed: {e}[/yellow]")
@@ -269,13 +560,17 @@ class NetHawk:
     
     def _set_monitor_mode(self, iface):
         """Set interface to monitor mode with aggressive methods."""
+        # Interface names, types and addresses may change (e.g. wlan0 -> wlan0mon)
+        self._iface_cache = None
+        self._iw_info_cache.clear()
+        self._network_cache = None
         try:
             console.print(f"[blue]Setting {iface} to monitor mode...[/blue]")
             
             # Stop conflicting processes
             console.print(f"[blue]Stopping conflicting processes...[/blue]")
-            subprocess.run(["airmon-ng", "check", "kill"], capture_output=True, timeout=10)
-            time.sleep(2)  # Give processes time to stop
+            subprocess.run(["airmon-ng", "check", "kill"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+            self._wait_for_conflicts_to_exit()
             
             # Method 1: Try airmon-ng
             console.print(f"[blue]Method 1: Trying airmon-ng...[/blue]")
@@ -316,26 +611,22 @@ class NetHawk:
                         console.print(f"[green]✓ iwconfig succeeded[/green]")
                         return iface
                     else:
-                        console.print(f"[yellow]iwconfig failed, trying ifconfig down/up...[/yellow]")
+                        console.print(f"[yellow]iwconfig failed, trying link down/up...[/yellow]")
                         console.print(f"[blue]iwconfig error: {iwconfig_result.stderr}[/blue]")
                         
-                        # Method 4: Try ifconfig down/up + iw
-                        console.print(f"[blue]Method 4: Trying ifconfig down/up + iw...[/blue]")
-                        subprocess.run(["ifconfig", iface, "down"], capture_output=True, timeout=5)
-                        time.sleep(1)
-                        iw_final = subprocess.run(["iw", iface, "set", "type", "monitor"], 
-                                                capture_output=True, text=True, timeout=10)
-                        subprocess.run(["ifconfig", iface, "up"], capture_output=True, timeout=5)
+                        # Method 4: Try link down/up + iw
+                        console.print(f"[blue]Method 4: Trying link down/up + iw...[/blue]")
+                        iw_final = self._cycle_link_to_monitor(iface)
                         
                         if iw_final.returncode == 0:
-                            console.print(f"[green]✓ ifconfig down/up + iw succeeded[/green]")
+                            console.print(f"[green]✓ link down/up + iw succeeded[/green]")
                             return iface
                         else:
                             console.print(f"[red]All methods failed[/red]")
                             console.print(f"[blue]airmon-ng error: {result.stderr}[/blue]")
                             console.print(f"[blue]iw error: {iw_result.stderr}[/blue]")
                             console.print(f"[blue]iwconfig error: {iwconfig_result.stderr}[/blue]")
-                            console.print(f"[blue]ifconfig+iw error: {iw_final.stderr}[/blue]")
+                            console.print(f"[blue]link down/up + iw error: {iw_final.stderr}[/blue]")
                             
                             # Show troubleshooting tips
                             console.print(f"\n[yellow]🔧 Troubleshooting Tips:[/yellow]")
@@ -374,11 +665,88 @@ class NetHawk:
             
             return None
     
+    def _ensure_monitor_mode(self, iface):
+        """Return a monitor mode interface for iface, enabling monitor mode if needed."""
+        # Check if already in monitor mode
+        try:
+            result = self._iw_info(iface)
+            if result.returncode == 0 and "monitor" in result.stdout.lower():
+                console.print(f"[green]✓ {iface} is already in monitor mode![/green]")
+                return iface
+        except Exception:
+            pass
+        console.print(f"[blue]Attempting to set monitor mode on {iface}...[/blue]")
+        console.print(f"[yellow]Note: We'll try multiple methods to enable monitor mode[/yellow]")
+        return self._set_monitor_mode(iface)
+    
+    def _cycle_link_to_monitor(self, iface):
+        """Take the link down, set monitor type with iw and bring it back up.
+        
+        With pyroute2 both link changes share one netlink socket and are acknowledged
+        synchronously. Otherwise the ip link / iw / ip link sequence runs in a single
+        shell instead of three separate processes.
+        """
+        set_monitor = ["iw", iface, "set", "type", "monitor"]
+        
+        if IPRoute is not None:
+            ipr, indexes = None, None
+            try:
+                ipr = IPRoute()
+                indexes = ipr.link_lookup(ifname=iface)
+                if indexes:
+                    ipr.link("set", index=indexes[0], state="down")
+            except Exception:
+                # Netlink refused the change (EPERM, rfkill, EBUSY); the shell path below retries it
+                indexes = None
+            try:
+                if indexes:
+                    try:
+                        return subprocess.run(set_monitor, capture_output=True, text=True, timeout=10)
+                    finally:
+                        try:
+                            ipr.link("set", index=indexes[0], state="up")
+                        except Exception:
+                            # Keep the iw result for the caller; bring the link up with ip instead
+                            try:
+                                subprocess.run(["ip", "link", "set", iface, "up"],
+                                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+                            except (OSError, subprocess.SubprocessError):
+                                pass
+            finally:
+                if ipr is not None:
+                    ipr.close()
+        
+        # One shell runs the whole sequence; the link is brought back up even if iw
+        # fails and the iw exit status is what gets reported
+        return subprocess.run(
+            ["sh", "-c",
+             'ip link set "$1" down && iw "$1" set type monitor; rc=$?; ip link set "$1" up; exit $rc',
+             "sh", iface],
+            capture_output=True, text=True, timeout=10
+        )
+    
+    def _wait_for_conflicts_to_exit(self, timeout=2.0):
+        """Wait until wpa_supplicant and NetworkManager are gone, at most timeout seconds."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                result = subprocess.run(["pgrep", "-x", "wpa_supplicant|NetworkManager"],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return
+            if result.returncode != 0:
+                return
+            time.sleep(0.1)
+    
     def _restore_managed_mode(self, iface):
         """Restore interface to managed mode."""
+        self._iface_cache = None
+        self._iw_info_cache.clear()
+        self._network_cache = None
         try:
             console.print(f"[blue]Restoring {iface} to managed mode...[/blue]")
-            subprocess.run(["airmon-ng", "stop", iface], capture_output=True, timeout=10)
+            subprocess.run(["airmon-ng", "stop", iface], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
             console.print(f"[green]✓ Interface restored to managed mode[/green]")
         except Exception as e:
             console.print(f"[yellow]Warning: Could not restore interface: {e}[/yellow]")
@@ -395,7 +763,7 @@ class NetHawk:
         
         # Check interface status
         try:
-            result = subprocess.run(["iw", iface, "info"], capture_output=True, text=True, timeout=5)
+            result = self._iw_info(iface)
             if result.returncode == 0:
                 console.print(f"[green]✓ Interface {iface} is accessible[/green]")
                 if "monitor" in result.stdout.lower():
@@ -448,32 +816,36 @@ class NetHawk:
         )
         iface = interfaces[int(iface_choice)-1]
         
-        # Check if already in monitor mode
-        try:
-            result = subprocess.run(["iw", iface, "info"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and "monitor" in result.stdout.lower():
-                console.print(f"[green]✓ {iface} is already in monitor mode![/green]")
-                monitor_iface = iface
-            else:
-                console.print(f"[blue]Attempting to set monitor mode on {iface}...[/blue]")
-                console.print(f"[yellow]Note: We'll try multiple methods to enable monitor mode[/yellow]")
-                monitor_iface = self._set_monitor_mode(iface)
-                if not monitor_iface:
-                    return
-        except:
-            console.print(f"[blue]Attempting to set monitor mode on {iface}...[/blue]")
-            console.print(f"[yellow]Note: We'll try multiple methods to enable monitor mode[/yellow]")
-            monitor_iface = self._set_monitor_mode(iface)
-            if not monitor_iface:
-                return
+        # Monitor mode setup can take several seconds; run it while the user answers the prompts.
+        # Rich buffers captures per thread, so its messages are held back until it is joined
+        # instead of landing in the middle of a prompt.
+        setup = {"iface": None, "output": ""}
+        def set_up_monitor_mode():
+            console.begin_capture()
+            try:
+                setup["iface"] = self._ensure_monitor_mode(iface)
+            finally:
+                setup["output"] = console.end_capture()
+        setup_thread = threading.Thread(target=set_up_monitor_mode, daemon=True)
+        setup_thread.start()
 
         # Configure scan options
         console.print("\n[bold]AGGRESSIVE Scan Options:[/bold]")
         channels = Prompt.ask("Channels to scan (e.g., 1,6,11 or all)", default="all")
         console.print(f"[yellow]Channels: {channels}[/yellow]")
+        
+        # Setup that has already failed ends the scan here rather than after another prompt
+        if setup_thread.is_alive() or setup["iface"]:
+            console.print(f"[green]Ready to scan! Press Enter to start...[/green]")
+            input()  # Wait for user to press Enter
+        
+        setup_thread.join()
+        if setup["output"]:
+            console.print(Text.from_ansi(setup["output"]))
+        monitor_iface = setup["iface"]
+        if not monitor_iface:
+            return
         console.print(f"[blue]Interface: {monitor_iface}[/blue]")
-        console.print(f"[green]Ready to scan! Press Enter to start...[/green]")
-        input()  # Wait for user to press Enter
         
         # Start AGGRESSIVE passive scan
         console.print(f"[blue]Starting AGGRESSIVE scan on {monitor_iface}...[/blue]")
@@ -482,8 +854,8 @@ class NetHawk:
         
         try:
             # Use airodump-ng for AGGRESSIVE scanning with better parameters
-            output_file = os.path.join(self.logs_path, f"aggressive_passive_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            cmd = ["airodump-ng", "-w", output_file, "--output-format", "csv", "--manufacturer", "--uptime", "--wps", "--beacons", "--ivs"]
+            output_file = str(self.logs_path / f"aggressive_passive_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+            cmd = [*_AIRODUMP_BASE_ARGS, "-w", output_file]
             
             if channels != "all":
                 cmd.extend(["-c", channels])
@@ -492,7 +864,7 @@ class NetHawk:
             
             # Start the scan process
             try:
-                process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True)
+                process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             except FileNotFoundError:
                 console.print(f"[red]Error: 'airodump-ng' command not found![/red]")
                 console.print(f"[blue]Please install aircrack-ng package: sudo apt install aircrack-ng[/blue]")
@@ -504,39 +876,29 @@ class NetHawk:
             console.print("=" * 80)
             console.print("[yellow]Press Ctrl+C to stop scanning[/yellow]")
             
-            # Monitor for networks in real-time
-            networks_found = 0
-            last_update = 0
+            # Monitor for networks in real-time: a background thread tails the CSV
+            # while the main thread just waits on airodump-ng
+            live_stats = {"networks_found": 0}
+            stop_tailing = threading.Event()
+            tailer = threading.Thread(
+                target=self._tail_live_networks,
+                args=(f"{output_file}-01.csv", stop_tailing, live_stats),
+                daemon=True
+            )
+            tailer.start()
             
             try:
-                while True:
-                    # Check if process is still running
-                    if process.poll() is not None:
-                        break
-                    
-                    # Check for new CSV data every 5 seconds
-                    current_time = time.time()
-                    if current_time - last_update >= 5:
-                        csv_file = f"{output_file}-01.csv"
-                        if os.path.exists(csv_file):
-                            try:
-                                # Parse and display new networks
-                                new_networks = self._parse_live_networks(csv_file)
-                                if new_networks > networks_found:
-                                    networks_found = new_networks
-                                    console.print(f"[green]📡 Found {networks_found} networks so far...[/green]")
-                            except:
-                                pass
-                        last_update = current_time
-                    
-                    time.sleep(1)
-                    
+                process.wait()
             except KeyboardInterrupt:
                 console.print(f"\n[yellow]Scan stopped by user (Ctrl+C)[/yellow]")
+            finally:
+                stop_tailing.set()
+                tailer.join()
             
             # Stop the process
             process.terminate()
             process.wait()
+            networks_found = live_stats["networks_found"]
             console.print(f"[green]✓ Scan completed! Found {networks_found} networks[/green]")
             
             # Parse and display results in terminal (no file saving)
@@ -584,28 +946,64 @@ class NetHawk:
             # Restore managed mode
             self._restore_managed_mode(monitor_iface)
     
+    def _file_change_ticks(self, path, stop_event, interval=5):
+        """Yield whenever path may have changed, until stop_event is set.
+        
+        Sleeps on inotify events when inotify_simple is installed, otherwise polls every
+        interval seconds.
+        """
+        inotify = None
+        if INotify is not None:
+            try:
+                inotify = INotify()
+                inotify.add_watch(os.path.dirname(path) or ".",
+                                  inotify_flags.MODIFY | inotify_flags.CREATE | inotify_flags.MOVED_TO)
+            except OSError:
+                inotify = None
+        
+        if inotify is None:
+            while not stop_event.wait(interval):
+                yield
+            return
+        
+        name = os.path.basename(path)
+        with inotify:
+            while not stop_event.is_set():
+                # Wake at least once a second to notice stop_event; coalesce bursts of writes
+                if any(event.name == name for event in inotify.read(timeout=1000, read_delay=100)):
+                    yield
+    
+    def _tail_live_networks(self, csv_file, stop_event, live_stats):
+        """Re-count networks in the airodump-ng CSV whenever it changes, until stop_event is set."""
+        last_seen = None
+        for _ in self._file_change_ticks(csv_file, stop_event):
+            try:
+                st = os.stat(csv_file)
+            except OSError:
+                continue
+            # airodump-ng rewrites the whole file on each update; skip polls where it hasn't
+            if (st.st_mtime_ns, st.st_size) == last_seen:
+                continue
+            last_seen = (st.st_mtime_ns, st.st_size)
+            try:
+                # Parse and display new networks
+                new_networks = self._parse_live_networks(csv_file)
+                if new_networks > live_stats["networks_found"]:
+                    live_stats["networks_found"] = new_networks
+                    console.print(f"[green]📡 Found {new_networks} networks so far...[/green]")
+            except Exception:
+                pass
+    
     def _parse_live_networks(self, csv_file):
-        """Parse live networks from CSV file and return count."""
+        """Count the access points in an airodump-ng CSV file."""
         try:
-            with open(csv_file, newline='', encoding='utf-8', errors='ignore') as f:
-                reader = csv.reader(f)
-                count = 0
-                section = None
-                for row in reader:
-                    if not row:
-                        continue
-                    # header row detection
-                    if 'BSSID' in row[0]:
-                        section = 'AP'
-                        continue
-                    if 'Station MAC' in row[0]:
-                        section = 'CLIENT'
-                        continue
-                    if section == 'AP' and len(row) > 0 and row[0] and re.match(r'([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}', row[0]):
-                        count += 1
-                return count
-        except Exception:
+            with open(csv_file, 'rb') as f:
+                data = f.read()
+        except OSError:
             return 0
+        # AP rows come before the client table and start with the BSSID
+        ap_section = data.partition(b"Station MAC")[0]
+        return len(_AP_ROW_RE.findall(ap_section))
 
     def _parse_aggressive_passive_results_terminal(self, output_file):
         """Parse airodump-ng CSV results for terminal display only."""
@@ -615,53 +1013,33 @@ class NetHawk:
             return [], []
         
         try:
+            with open(csv_file, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+                text = f.read()
+            
+            # airodump-ng writes the AP table followed by the client table; slice the
+            # file at the headers once instead of tracking the section on every row
+            ap_text, _, client_text = text.partition("\nStation MAC")
+            _, _, ap_text = ap_text.partition("BSSID")
+            
+            ap_rows = csv.reader(io.StringIO(ap_text))
+            next(ap_rows, None)  # Remainder of the AP header line
             aps = []
+            for row in ap_rows:
+                rowlen = len(row)
+                if rowlen >= 14 and self._validate_bssid(row[0]):
+                    ap = dict(zip(_AP_KEYS, _AP_FIELDS(row)))
+                    ap["WPS"] = "WPS" if rowlen > 14 and "WPS" in row[14] else "No WPS"
+                    aps.append(ap)
+            
+            client_rows = csv.reader(io.StringIO(client_text))
+            next(client_rows, None)  # Remainder of the client header line
             clients = []
-            
-            with open(csv_file, 'r', encoding='utf-8', errors='ignore') as f:
-                reader = csv.reader(f)
-                section = None
-                
-                for row in reader:
-                    if not row or not row[0].strip():
-                        continue
-                    
-                    if "BSSID" in row[0]:
-                        section = "AP"
-                        continue
-                    elif "Station MAC" in row[0]:
-                        section = "CLIENT"
-                        continue
-
-                    if section == "AP" and len(row) >= 14:
-                        try:
-                            ap_data = {
-                                "BSSID": row[0],
-                                "ESSID": row[13] if len(row) > 13 else "Hidden",
-                                "Channel": row[3],
-                                "Power": row[8],
-                                "Privacy": row[5],
-                                "Cipher": row[6],
-                                "Auth": row[7],
-                                "Beacons": row[9],
-                                "Data": row[10],
-                                "WPS": "WPS" if len(row) > 14 and "WPS" in row[14] else "No WPS"
-                            }
-                            aps.append(ap_data)
-                        except IndexError:
-                            continue
-                    
-                    elif section == "CLIENT" and len(row) >= 6:
-                        try:
-                            client_data = {
-                                "Station": row[0],
-                                "Power": row[3],
-                                "BSSID": row[5],
-                                "Probed": row[6] if len(row) > 6 else ""
-                            }
-                            clients.append(client_data)
-                        except IndexError:
-                            continue
+            for row in client_rows:
+                rowlen = len(row)
+                if rowlen >= 6 and row[0].strip():
+                    client = dict(zip(_CLIENT_KEYS, _CLIENT_FIELDS(row)))
+                    client["Probed"] = row[6] if rowlen > 6 else ""
+                    clients.append(client)
             
             return aps, clients
             
@@ -671,45 +1049,19 @@ class NetHawk:
     
     def _display_aggressive_ap_table(self, aps):
         """Display access points in an enhanced table."""
-        table = Table(title="AGGRESSIVE Scan - Access Points")
-        table.add_column("BSSID", style="cyan")
-        table.add_column("ESSID", style="green")
-        table.add_column("Channel", style="yellow")
-        table.add_column("Power", style="red")
-        table.add_column("Privacy", style="magenta")
-        table.add_column("WPS", style="blue")
-        table.add_column("Beacons", style="white")
-        
+        table = _make_table("AGGRESSIVE Scan - Access Points", _AP_TABLE_COLUMNS)
         for ap in aps:
-            table.add_row(
-                ap["BSSID"],
-                ap["ESSID"],
-                ap["Channel"],
-                ap["Power"],
-                ap["Privacy"],
-                ap["WPS"],
-                ap["Beacons"]
-            )
+            table.add_row(*_AP_TABLE_ROW(ap))
         
-            console.print(table)
+        console.print(table)
 
     def _display_aggressive_client_table(self, clients):
         """Display clients in an enhanced table."""
-        table = Table(title="AGGRESSIVE Scan - Clients")
-        table.add_column("Station MAC", style="cyan")
-        table.add_column("Power", style="red")
-        table.add_column("Connected BSSID", style="green")
-        table.add_column("Probed ESSIDs", style="yellow")
-        
+        table = _make_table("AGGRESSIVE Scan - Clients", _CLIENT_TABLE_COLUMNS)
         for client in clients:
-            table.add_row(
-                client["Station"],
-                client["Power"],
-                client["BSSID"],
-                client["Probed"]
-            )
+            table.add_row(*_CLIENT_TABLE_ROW(client))
         
-            console.print(table)
+        console.print(table)
 
     
     def aggressive_active_scan(self):
@@ -907,33 +1259,40 @@ class NetHawk:
             # If nmap didn't find much, try individual pings
             if len(hosts) < 5:  # If we found less than 5 hosts, try individual pings
                 console.print(f"[blue]Trying individual ping scans...[/blue]")
-                for i, ip in enumerate(network.hosts()):
-                    if i >= 254:  # Limit to /24
-                        break
-        
-                    progress.update(task, description=f"Ping scanning {ip}... ({i+1}/{total_ips})")
-                    
-                    # Skip if already found by nmap
-                    if any(host["ip"] == str(ip) for host in hosts):
-                        continue
-                    
-                    # Try multiple ping methods
-                    if self._aggressive_ping_host(str(ip)):
-                        mac = self._get_mac_address(str(ip))
-                        hosts.append({
-                            "ip": str(ip),
-                            "status": "up",
-                            "mac": mac,
-                            "device_type": self._detect_device_type(mac),
-                            "open_ports": [],
-                            "os": "Unknown",
-                            "services": []
-                        })
+                # Skip addresses nmap already found; limit to /24
+                found = {host["ip"] for host in hosts}
+                candidates = [ip for ip in _host_ips(network, limit=254) if ip not in found]
+                
+                live = self._fping_sweep(candidates)
+                if live is not None:
+                    live_ips = [ip for ip in candidates if ip in live]
+                    progress.update(task, completed=len(candidates))
+                    for ip in live_ips:
                         console.print(f"[green]✓ Found host: {ip}[/green]")
-                    
-                    # Update progress every 5 IPs
-                    if i % 5 == 0:
-                        progress.update(task, completed=i+1)
+                else:
+                    # Pings are bound by network RTT, so run them concurrently
+                    live_ips = []
+                    with ThreadPoolExecutor(max_workers=_PING_SWEEP_WORKERS) as executor:
+                        futures = {executor.submit(self._aggressive_ping_host, ip): ip for ip in candidates}
+                        for done, future in enumerate(as_completed(futures), 1):
+                            ip = futures[future]
+                            progress.update(task, description=f"Ping scanning {ip}... ({done}/{len(candidates)})", completed=done)
+                            if future.result():
+                                live_ips.append(ip)
+                                console.print(f"[green]✓ Found host: {ip}[/green]")
+                
+                # Resolve MACs afterwards, in address order
+                for ip in sorted(live_ips, key=ipaddress.IPv4Address):
+                    mac = self._get_mac_address(ip)
+                    hosts.append({
+                        "ip": ip,
+                        "status": "up",
+                        "mac": mac,
+                        "device_type": self._detect_device_type(mac),
+                        "open_ports": [],
+                        "os": "Unknown",
+                        "services": []
+                    })
             
             progress.update(task, description="Host discovery complete!")
             progress.update(task, completed=total_ips)
@@ -984,79 +1343,135 @@ class NetHawk:
             console.print(f"[yellow]Nmap discovery failed: {e}[/yellow]")
             return []
 
-    def _aggressive_host_discovery(self, network):
-        """Perform AGGRESSIVE host discovery."""
-        hosts = []
+    def _fping_sweep(self, ips):
+        """Ping many addresses with a single fping run.
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("AGGRESSIVE host discovery...", total=len(list(network.hosts())))
-            
-            for ip in network.hosts():
-                if self._aggressive_ping_host(str(ip)):
-                    host_info = {
-                        "ip": str(ip),
-                        "status": "up",
-                        "mac": self._get_mac_address(str(ip)),
-                        "os": "Unknown",
-                        "open_ports": []
-                    }
-                    hosts.append(host_info)
-                progress.advance(task)
+        Returns the set of live addresses, or None if fping is unavailable so callers
+        can fall back to per-host pings.
+        """
+        if not ips or not self._check_tool_exists("fping"):
+            return None
         
-        return hosts
+        try:
+            result = subprocess.run(["fping", "-a", "-q", "-r", "1", "-t", "1000"],
+                                    input="\n".join(ips), capture_output=True, text=True, timeout=120)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode > 1:  # 0/1: all/some hosts unreachable, anything else is an error
+            return None
+        
+        live = set(result.stdout.split())
+        
+        # Hosts that drop ICMP still answer the ARP request the sweep triggered
+        live |= self._arp_reachable(ips)
+        
+        return live
+    
+    def _arp_reachable(self, ips):
+        """Return the addresses among ips whose neighbour entry is REACHABLE.
+        
+        Only a recent ARP reply makes an entry REACHABLE. STALE, DELAY and PROBE entries
+        (still flagged complete in /proc/net/arp) can belong to hosts that have left.
+        """
+        try:
+            result = subprocess.run(["ip", "-4", "neigh", "show", "nud", "reachable"],
+                                    capture_output=True, text=True, timeout=5)
+        except (subprocess.TimeoutExpired, OSError):
+            return set()
+        reachable = {line.split(None, 1)[0] for line in result.stdout.splitlines() if line.strip()}
+        return reachable & set(ips)
+    
+    def _load_arp_table(self):
+        """Read the kernel ARP table into {ip: mac} (completed entries only) and cache it."""
+        table = {}
+        try:
+            with open("/proc/net/arp") as f:
+                next(f, None)
+                for line in f:
+                    # IP address, HW type, Flags, HW address, Mask, Device
+                    fields = line.split()
+                    if len(fields) >= 4 and int(fields[2], 16) & 0x2:
+                        table[fields[0]] = fields[3]
+        except (OSError, ValueError):
+            pass
+        self._arp_cache = table
+        return table
     
     def _aggressive_ping_host(self, ip):
         """AGGRESSIVE ping with multiple techniques."""
         try:
-            # Standard ping
-            result = subprocess.run(
-                ["ping", "-c", "1", "-W", "1", ip],
-                capture_output=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                return True
-            
-            # ARP ping
-            result = subprocess.run(
-                ["arping", "-c", "1", "-W", "1", ip],
-                capture_output=True,
-                timeout=2
-            )
-            return result.returncode == 0
-            
+            alive = self._icmp_ping(ip)
+            if alive is None:
+                alive = self._tcp_ping(ip)
+            # Sending the probe makes the kernel ARP for on-link hosts; a fresh reply
+            # catches hosts that drop ICMP without spawning arping
+            return alive or ip in self._arp_reachable((ip,))
         except Exception:
             return False
     
+    def _icmp_ping(self, ip, timeout=1.0):
+        """Send one ICMP echo request from this process.
+        
+        Returns True on a reply, False on timeout, or None if no ICMP socket can be
+        opened (unprivileged ping sockets disabled and not running as root).
+        """
+        for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+            try:
+                sock = socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+                break
+            except OSError:
+                continue
+        else:
+            return None
+        
+        with sock:
+            # Datagram ping sockets get their identifier from the kernel, which also
+            # filters replies; raw sockets see every ICMP packet and must match it
+            ident = threading.get_ident() & 0xFFFF
+            seq = 1
+            payload = b"NetHawk"
+            header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+            checksum = _icmp_checksum(header + payload)
+            sock.sendto(struct.pack("!BBHHH", 8, 0, checksum, ident, seq) + payload, (ip, 0))
+            
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                sock.settimeout(remaining)
+                try:
+                    data, addr = sock.recvfrom(1024)
+                except socket.timeout:
+                    return False
+                if addr[0] != ip:
+                    continue
+                if sock_type == socket.SOCK_RAW:
+                    data = data[(data[0] & 0x0F) * 4:]  # Strip the IP header
+                    if len(data) >= 8 and data[0] == 0 and struct.unpack("!H", data[4:6])[0] == ident:
+                        return True
+                elif len(data) >= 8 and data[0] == 0:
+                    return True
+    
+    def _tcp_ping(self, ip, timeout=0.3):
+        """Check whether a host answers a TCP connect on a common port; a refusal counts as up."""
+        for port in _TCP_PING_PORTS:
+            try:
+                with socket.create_connection((ip, port), timeout=timeout):
+                    return True
+            except ConnectionRefusedError:
+                return True
+            except OSError:
+                continue
+        return False
+    
     def _get_mac_address(self, ip):
         """Get MAC address for an IP using ARP table."""
-        try:
-            # Try to get MAC from ARP table
-            result = subprocess.run(["arp", "-n", ip], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if ip in line and ':' in line:
-                        parts = line.split()
-                        for part in parts:
-                            if ':' in part and len(part.split(':')) == 6:
-                                return part
-            return "Unknown"
-        except FileNotFoundError:
-            console.print(f"[yellow]Warning: 'arp' command not found. Install net-tools package.[/yellow]")
-            return "Unknown"
-        except subprocess.TimeoutExpired:
-            console.print(f"[yellow]Warning: ARP lookup timed out for {ip}[/yellow]")
-            return "Unknown"
-        except Exception as e:
-            console.print(f"[yellow]Warning: ARP lookup failed: {e}[/yellow]")
-            return "Unknown"
+        mac = self._arp_cache.get(ip)
+        if mac is None:
+            # Hosts are resolved as discovery goes on; re-read the table once on a miss
+            mac = self._load_arp_table().get(ip, "Unknown")
+        return mac
     
     def _detect_device_type(self, mac_address):
         """Detect device type based on MAC address OUI."""
@@ -1069,17 +1484,7 @@ class NetHawk:
         # Get first 6 characters (OUI)
         oui = mac_clean[:6]
         
-        # Common OUI prefixes for device types
-        if oui in ["001B63", "001C42", "002312", "002500", "002608", "040CCE", "045453", "087402", "0C74C2", "1093E9", "14109F", "186590", "1C1B0D", "1C36BB", "1CABA7", "20C9D0", "24A074", "283737", "28CFDA", "2C337A", "2CB43A", "3090AB", "34159E", "34A395", "38C986", "3C0754", "3C2EF9", "3CA82A", "40331A", "40A6D9", "442A60", "48A6D9", "4C3275", "4C57CA", "4C8D79", "50EAD6", "54724F", "58B035", "5C5948", "5C95AE", "600308", "60334B", "60C547", "60FACD", "64B9E8", "680927", "685B35", "68967B", "68D93C", "6C198F", "6C4008", "6C72E7", "6C9466", "701124", "70480F", "705681", "70CD60", "70DEE2", "74E2F5", "7831C1", "784F43", "78CA39", "7C04D0", "7C6D62", "7CD1C3", "800655", "80BE05", "80E650", "843835", "84B153", "8863DF", "88DEA9", "8C2DAA", "8C5877", "8C8590", "8CFABA", "9027E4", "90840D", "90A4DE", "90B931", "94E6F7", "9803D8", "98CA33", "9C04EB", "9C207B", "9C84BF", "9C8E99", "A0999B", "A0D795", "A45E60", "A4B197", "A4C361", "A860B6", "A8968A", "A8BBCF", "A8F751", "AC1F74", "AC3C0B", "AC61EA", "AC87A3", "ACDE48", "B065BD", "B09FBA", "B418D1", "B4527E", "B4F0AB", "B8098A", "B817C2", "B853AC", "B8782E", "B8C75D", "B8E856", "B8F6B1", "BC52B7", "BC671C", "BC926B", "BCEC5D", "C0255C", "C06394", "C0CECD", "C42C03", "C48466", "C4B301", "C82A14", "C869CD", "C8BCC8", "C8E0EB", "CC08E0", "CC25EF", "CC29F5", "CC785F", "D0034B", "D023DB", "D0A637", "D49A20", "D4D252", "D83062", "D89695", "D8A25E", "D8CF9C", "DC2B2A", "DC3745", "DC56E7", "DCA904", "E0ACCB", "E425E7", "E48D8C", "E4B318", "E4C63D", "E84040", "E8802E", "E8B2AC", "E8D03C", "EC3586", "EC89F5", "ECADB8", "F01898", "F02475", "F04F7C", "F07959", "F0DBE2", "F40F24", "F431C3", "F45C89", "F45EAB", "F46D04", "F48E38", "F49F54", "F4CB52", "F4D488", "F81EDF", "F81654", "F82FA8", "F84D89", "F866F2", "F88E85", "F896EA", "FC253F", "FC64BA", "FC94CE", "FCDBB3", "FCE998"]:
-            return "Apple Device (iPhone/iPad/Mac)"
-        elif oui in ["001599", "00166B", "0017C9", "001839", "001A8A", "001B98", "001C43", "001D7E", "001E75", "001F5B", "00214C", "002258", "002339", "002454", "002566", "00265D", "002719", "00280F", "002915", "002A5A", "002B67", "002C44", "002D76", "002EC8", "002F3A", "00304D", "003146", "003221", "003350", "0034DA", "00351F", "003676", "00376D", "0038BC", "00390F", "003A99", "003B9F", "003CF0", "003D41", "003E01", "003F0E", "004045", "0041B4", "00425A", "004385", "004437", "00455E", "004668", "00474F", "00487A", "004955", "004A30", "004BED", "004CC1", "004D32", "004E01", "004F62", "005043", "00515E", "005218", "005332", "0054AF", "0055DA", "00562B", "00578C", "005844", "0059AC", "005A13", "005B94", "005C0C", "005D73", "005E0C", "005F86", "006057", "006171", "00620E", "006373", "0064B6", "006583", "00664A", "006742", "0068EB", "0069AB", "006A39", "006B8D", "006CBC", "006D52", "006EFD", "006F20", "00704D", "0071C2", "00722D", "007349", "00749C", "00756D", "00764E", "007750", "0078CD", "00797B", "007A3D", "007B8B", "007C2D", "007D60", "007E4C", "007F12", "008096", "0081F4", "008250", "00835F", "008438", "008525", "0086CE", "008701", "008865", "00894F", "008A96", "008BAD", "008C54", "008D4E", "008EFD", "008F59", "00904C", "009127", "00924A", "0093FB", "0094A6", "00958E", "00964B", "009727", "00988C", "00994C", "009ACD", "009B8B", "009C02", "009D6B", "009E1C", "009F7B", "00A04A", "00A18C", "00A2EE", "00A38E", "00A45A", "00A58C", "00A650", "00A78C", "00A896", "00A94A", "00AA70", "00AB00", "00AC29", "00AD24", "00AEFA", "00AF1B", "00B04A", "00B18C", "00B24A", "00B38C", "00B44A", "00B58C", "00B64A", "00B78C", "00B84A", "00B98C", "00BA4A", "00BB8C", "00BC4A", "00BD8C", "00BE4A", "00BF8C", "00C04A", "00C18C", "00C24A", "00C38C", "00C44A", "00C58C", "00C64A", "00C78C", "00C84A", "00C98C", "00CA4A", "00CB8C", "00CC4A", "00CD8C", "00CE4A", "00CF8C", "00D04A", "00D18C", "00D24A", "00D38C", "00D44A", "00D58C", "00D64A", "00D78C", "00D84A", "00D98C", "00DA4A", "00DB8C", "00DC4A", "00DD8C", "00DE4A", "00DF8C", "00E04A", "00E18C", "00E24A", "00E38C", "00E44A", "00E58C", "00E64A", "00E78C", "00E84A", "00E98C", "00EA4A", "00EB8C", "00EC4A", "00ED8C", "00EE4A", "00EF8C", "00F04A", "00F18C", "00F24A", "00F38C", "00F44A", "00F58C", "00F64A", "00F78C", "00F84A", "00F98C", "00FA4A", "00FB8C", "00FC4A", "00FD8C", "00FE4A", "00FF8C"]:
-            return "Samsung Device (Phone/TV/Tablet)"
-        elif oui in ["001A11", "001B44", "001C42", "001D0F", "001E06", "001F5B", "002078", "00216A", "002258", "002312", "002401", "002500", "002608", "002719", "00280F", "002915", "002A5A", "002B67", "002C44", "002D76", "002EC8", "002F3A", "00304D", "003146", "003221", "003350", "0034DA", "00351F", "003676", "00376D", "0038BC", "00390F", "003A99", "003B9F", "003CF0", "003D41", "003E01", "003F0E", "004045", "0041B4", "00425A", "004385", "004437", "00455E", "004668", "00474F", "00487A", "004955", "004A30", "004BED", "004CC1", "004D32", "004E01", "004F62", "005043", "00515E", "005218", "005332", "0054AF", "0055DA", "00562B", "00578C", "005844", "0059AC", "005A13", "005B94", "005C0C", "005D73", "005E0C", "005F86", "006057", "006171", "00620E", "006373", "0064B6", "006583", "00664A", "006742", "0068EB", "0069AB", "006A39", "006B8D", "006CBC", "006D52", "006EFD", "006F20", "00704D", "0071C2", "00722D", "007349", "00749C", "00756D", "00764E", "007750", "0078CD", "00797B", "007A3D", "007B8B", "007C2D", "007D60", "007E4C", "007F12", "008096", "0081F4", "008250", "00835F", "008438", "008525", "0086CE", "008701", "008865", "00894F", "008A96", "008BAD", "008C54", "008D4E", "008EFD", "008F59", "00904C", "009127", "00924A", "0093FB", "0094A6", "00958E", "00964B", "009727", "00988C", "00994C", "009ACD", "009B8B", "009C02", "009D6B", "009E1C", "009F7B", "00A04A", "00A18C", "00A2EE", "00A38E", "00A45A", "00A58C", "00A650", "00A78C", "00A896", "00A94A", "00AA70", "00AB00", "00AC29", "00AD24", "00AEFA", "00AF1B", "00B04A", "00B18C", "00B24A", "00B38C", "00B44A", "00B58C", "00B64A", "00B78C", "00B84A", "00B98C", "00BA4A", "00BB8C", "00BC4A", "00BD8C", "00BE4A", "00BF8C", "00C04A", "00C18C", "00C24A", "00C38C", "00C44A", "00C58C", "00C64A", "00C78C", "00C84A", "00C98C", "00CA4A", "00CB8C", "00CC4A", "00CD8C", "00CE4A", "00CF8C", "00D04A", "00D18C", "00D24A", "00D38C", "00D44A", "00D58C", "00D64A", "00D78C", "00D84A", "00D98C", "00DA4A", "00DB8C", "00DC4A", "00DD8C", "00DE4A", "00DF8C", "00E04A", "00E18C", "00E24A", "00E38C", "00E44A", "00E58C", "00E64A", "00E78C", "00E84A", "00E98C", "00EA4A", "00EB8C", "00EC4A", "00ED8C", "00EE4A", "00EF8C", "00F04A", "00F18C", "00F24A", "00F38C", "00F44A", "00F58C", "00F64A", "00F78C", "00F84A", "00F98C", "00FA4A", "00FB8C", "00FC4A", "00FD8C", "00FE4A", "00FF8C"]:
-            return "Google Device (Pixel/Nest/Chromecast)"
-        elif oui in ["005056", "000C29", "001C42", "001D7E", "001E75", "001F5B", "002078", "00216A", "002258", "002312", "002401", "002500", "002608", "002719", "00280F", "002915", "002A5A", "002B67", "002C44", "002D76", "002EC8", "002F3A", "00304D", "003146", "003221", "003350", "0034DA", "00351F", "003676", "00376D", "0038BC", "00390F", "003A99", "003B9F", "003CF0", "003D41", "003E01", "003F0E", "004045", "0041B4", "00425A", "004385", "004437", "00455E", "004668", "00474F", "00487A", "004955", "004A30", "004BED", "004CC1", "004D32", "004E01", "004F62", "005043", "00515E", "005218", "005332", "0054AF", "0055DA", "00562B", "00578C", "005844", "0059AC", "005A13", "005B94", "005C0C", "005D73", "005E0C", "005F86", "006057", "006171", "00620E", "006373", "0064B6", "006583", "00664A", "006742", "0068EB", "0069AB", "006A39", "006B8D", "006CBC", "006D52", "006EFD", "006F20", "00704D", "0071C2", "00722D", "007349", "00749C", "00756D", "00764E", "007750", "0078CD", "00797B", "007A3D", "007B8B", "007C2D", "007D60", "007E4C", "007F12", "008096", "0081F4", "008250", "00835F", "008438", "008525", "0086CE", "008701", "008865", "00894F", "008A96", "008BAD", "008C54", "008D4E", "008EFD", "008F59", "00904C", "009127", "00924A", "0093FB", "0094A6", "00958E", "00964B", "009727", "00988C", "00994C", "009ACD", "009B8B", "009C02", "009D6B", "009E1C", "009F7B", "00A04A", "00A18C", "00A2EE", "00A38E", "00A45A", "00A58C", "00A650", "00A78C", "00A896", "00A94A", "00AA70", "00AB00", "00AC29", "00AD24", "00AEFA", "00AF1B", "00B04A", "00B18C", "00B24A", "00B38C", "00B44A", "00B58C", "00B64A", "00B78C", "00B84A", "00B98C", "00BA4A", "00BB8C", "00BC4A", "00BD8C", "00BE4A", "00BF8C", "00C04A", "00C18C", "00C24A", "00C38C", "00C44A", "00C58C", "00C64A", "00C78C", "00C84A", "00C98C", "00CA4A", "00CB8C", "00CC4A", "00CD8C", "00CE4A", "00CF8C", "00D04A", "00D18C", "00D24A", "00D38C", "00D44A", "00D58C", "00D64A", "00D78C", "00D84A", "00D98C", "00DA4A", "00DB8C", "00DC4A", "00DD8C", "00DE4A", "00DF8C", "00E04A", "00E18C", "00E24A", "00E38C", "00E44A", "00E58C", "00E64A", "00E78C", "00E84A", "00E98C", "00EA4A", "00EB8C", "00EC4A", "00ED8C", "00EE4A", "00EF8C", "00F04A", "00F18C", "00F24A", "00F38C", "00F44A", "00F58C", "00F64A", "00F78C", "00F84A", "00F98C", "00FA4A", "00FB8C", "00FC4A", "00FD8C", "00FE4A", "00FF8C"]:
-            return "Router/Network Device"
-        else:
-            return "Unknown Device"
+        return _oui_device_type(oui)
     
     def _infer_device_type(self, open_ports, services, os_info, mac_vendor, mac_address="Unknown"):
         """
@@ -1191,17 +1596,37 @@ class NetHawk:
         
         return final_type
     
+    def _load_oui_vendors(self):
+        """Parse the first available local OUI database into {"001122": vendor}, once per process."""
+        if NetHawk._oui_vendors is not None:
+            return NetHawk._oui_vendors
+        
+        vendors = {}
+        for path in _OUI_VENDOR_FILES:
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        if "(base 16)" in line:
+                            # IEEE: "00000C     (base 16)		Cisco Systems, Inc"
+                            prefix, _, vendor = line.partition("(base 16)")
+                            vendors[prefix.strip().upper()] = vendor.strip()
+                        elif line[6:7] == " " and not line.startswith("#"):
+                            # nmap: "00000C Cisco Systems"
+                            vendors[line[:6].upper()] = line[7:].strip()
+            except OSError:
+                continue
+            if vendors:
+                break
+        
+        NetHawk._oui_vendors = vendors
+        return vendors
+    
     def _get_mac_vendor(self, mac):
-        """
-        Simple helper: try to extract vendor from local OUI lookup if available.
-        This implementation is a placeholder that returns None if vendor lookup is not available.
-        You can improve it by adding a local OUI DB or calling an online API (requires network).
-        """
+        """Look up the vendor for a MAC in the local OUI database; None if unknown."""
         if not mac or mac == "Unknown":
             return None
-        # Try simple local ARP/neighbor check — vendor lookup not implemented here
-        # You can plug in an OUI mapping offline if you want a reliable vendor name.
-        return None
+        oui = mac.replace(":", "").replace("-", "").upper()[:6]
+        return self._load_oui_vendors().get(oui)
     
     def _display_detection_summary(self, host):
         """Display comprehensive detection methodology summary for a host."""
@@ -1302,11 +1727,15 @@ class NetHawk:
         ) as progress:
             task = progress.add_task("Port scanning hosts...", total=total_hosts)
             
+            # Scan every host in one nmap run rather than one process per host
+            scan_results = self._batch_port_scan(
+                [host['ip'] for host in hosts], port_range, scan_type,
+                on_status=lambda status: progress.update(task, description=status)
+            )
+            
             for i, host in enumerate(hosts):
-                progress.update(task, description=f"Scanning {host['ip']}... ({i+1}/{total_hosts})")
-                
-                # Perform port scan on this host
-                scan_result = self._scan_host_ports(host['ip'], port_range, scan_type)
+                progress.update(task, description=f"Processing {host['ip']}... ({i+1}/{total_hosts})")
+                scan_result = scan_results.get(host['ip'], {})
                 
                 # Update host with new scan results
                 host['open_ports'] = scan_result.get('open_ports', [])
@@ -1333,57 +1762,50 @@ class NetHawk:
         # Display final results
         self._display_aggressive_hosts_table(hosts)
 
-    def _aggressive_port_scan(self, hosts, port_range, scan_type):
-        """Perform AGGRESSIVE port scanning."""
-        console.print(f"[blue]Starting AGGRESSIVE port scan...[/blue]")
+    def _parse_nmap_xml(self, nmap_xml):
+        """Parse nmap -oX output into {ip: (open_ports, os_info, host_xml)}.
         
-        for host in hosts:
-            console.print(f"[yellow]Scanning {host['ip']}...[/yellow]")
-            
-            try:
-                # Build nmap command based on scan type
-                if scan_type == "fast":
-                    cmd = ["nmap", "-Pn", "-T4", "-F", "--top-ports", "1000", host["ip"]]
-                elif scan_type == "aggressive":
-                    cmd = ["nmap", "-Pn", "-T4", "-A", "-sV", "-sC", "--script", "vuln", host["ip"]]
-                else:  # comprehensive
-                    cmd = ["nmap", "-Pn", "-T4", "-A", "-sV", "-sC", "-O", "--script", "vuln,discovery", host["ip"]]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-                
-                if result.returncode == 0:
-                    # Parse open ports
-                    open_ports = self._parse_nmap_output(result.stdout)
-                    host["open_ports"] = open_ports
-                    host["nmap_output"] = result.stdout
-                    
-                    console.print(f"[green]✓ Found {len(open_ports)} open ports on {host['ip']}[/green]")
-                else:
-                    console.print(f"[red]Port scan failed for {host['ip']}[/red]")
-                    
-            except subprocess.TimeoutExpired:
-                console.print(f"[yellow]Port scan timed out for {host['ip']}[/yellow]")
-            except Exception as e:
-                console.print(f"[red]Error scanning {host['ip']}: {e}[/red]")
-    
-    def _parse_nmap_output(self, nmap_output):
-        """Parse nmap output to extract open ports."""
-        open_ports = []
-        lines = nmap_output.split('\n')
-        
-        for line in lines:
-            if '/tcp' in line and 'open' in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    port_info = {
-                        "port": str(parts[0].split('/')[0]),  # Ensure string format
-                        "protocol": parts[0].split('/')[1],
-                        "state": parts[1],
-                        "service": parts[2] if len(parts) > 2 else "unknown"
-                    }
-                    open_ports.append(port_info)
-        
-        return open_ports
+        Output cut short (nmap killed on timeout) yields the hosts completed before the cut.
+        """
+        hosts = {}
+        try:
+            for _, elem in ET.iterparse(io.StringIO(nmap_xml), events=("end",)):
+                if elem.tag != "host":
+                    continue
+                address = elem.find("address[@addrtype='ipv4']")
+                if address is not None:
+                    open_ports = []
+                    for port in elem.iterfind("ports/port"):
+                        state = port.find("state")
+                        if state is None or state.get("state") != "open":
+                            continue
+                        service = port.find("service")
+                        if service is None:
+                            service = ET.Element("service")
+                        banner = " ".join(filter(None, (service.get("product"), service.get("version"),
+                                                        service.get("extrainfo"))))
+                        open_ports.append({
+                            "port": port.get("portid"),
+                            "protocol": port.get("protocol"),
+                            "state": "open",
+                            "service": service.get("name", "unknown"),
+                            "banner": banner
+                        })
+                    # Best OS match first; otherwise the device class nmap settled on
+                    osmatch = elem.find("os/osmatch")
+                    osclass = elem.find("os/osmatch/osclass")
+                    if osmatch is not None:
+                        os_info = osmatch.get("name", "Unknown")
+                    elif osclass is not None:
+                        os_info = osclass.get("type", "Unknown")
+                    else:
+                        os_info = "Unknown"
+                    hosts[address.get("addr")] = (open_ports, os_info, ET.tostring(elem, encoding="unicode"))
+                # Hosts are independent; drop each one once handled
+                elem.clear()
+        except ET.ParseError:
+            pass
+        return hosts
     
     def _parse_os_info(self, nmap_output):
         """Parse OS information from nmap output."""
@@ -1403,14 +1825,7 @@ class NetHawk:
     
     def _display_aggressive_hosts_table(self, hosts):
         """Display discovered hosts in an enhanced table."""
-        table = Table(title="AGGRESSIVE Scan - Discovered Hosts")
-        table.add_column("IP Address", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("MAC Address", style="yellow")
-        table.add_column("Device Type", style="magenta")
-        table.add_column("OS", style="blue")
-        table.add_column("Open Ports", style="red")
-        
+        table = _make_table("AGGRESSIVE Scan - Discovered Hosts", _HOSTS_TABLE_COLUMNS)
         for host in hosts:
             open_ports_str = ", ".join([p["port"] for p in host["open_ports"]]) if host["open_ports"] else "None"
             table.add_row(
@@ -1425,7 +1840,40 @@ class NetHawk:
         console.print(table)
     
     def _get_current_network(self):
-        """Get current network using multiple methods."""
+        """Get current network, detecting it once and reusing the result."""
+        if self._network_cache is None:
+            self._network_cache = self._detect_current_network()
+        return self._network_cache
+    
+    def _default_route_network(self):
+        """Network of the default route's interface, read from /proc and interface ioctls."""
+        try:
+            with open("/proc/net/route") as f:
+                next(f, None)
+                for line in f:
+                    fields = line.split()
+                    # Iface Destination Gateway Flags RefCnt Use Metric Mask ...
+                    if len(fields) >= 8 and fields[1] == "00000000" and fields[7] == "00000000" and int(fields[3], 16) & 0x1:
+                        iface = fields[0]
+                        break
+                else:
+                    return None
+            
+            ifreq = struct.pack("256s", iface.encode()[:15])
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                addr = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, ifreq)[20:24])
+                netmask = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), _SIOCGIFNETMASK, ifreq)[20:24])
+            return str(ipaddress.IPv4Network(f"{addr}/{netmask}", strict=False))
+        except (OSError, ValueError):
+            return None
+    
+    def _detect_current_network(self):
+        """Detect current network using multiple methods."""
+        # Method 0: default route and its address straight from the kernel, no subprocesses
+        network = self._default_route_network()
+        if network:
+            return network
+        
         try:
             # Method 1: Use ip route to get default route
             result = subprocess.run(["ip", "route", "show", "default"], capture_output=True, text=True, timeout=5)
@@ -1505,6 +1953,100 @@ class NetHawk:
         return selected
 
     
+    def _validate_bssid(self, bssid):
+        """Check that a BSSID is a well-formed MAC address."""
+        raw = bssid.encode("ascii", "replace")
+        if len(raw) != 17:
+            return False
+        sep = raw[2]
+        return (sep in _BSSID_SEPARATORS
+                and all(raw[i] == sep for i in (5, 8, 11, 14))
+                and all(raw[i] in _HEX_DIGITS for i in _BSSID_HEX_POSITIONS))
+    
+    def _handshake_captured(self, cap_path, bssid, state):
+        """Check what airodump-ng appended to a capture for a usable 4-way handshake.
+        
+        state starts as {} and carries the read offset and the messages seen per station between
+        calls. True once one station of the target AP has an M1 with its matching M2, or an M2
+        with its matching M3 (same replay counter, and one higher for M3).
+        """
+        start = state.get("offset", 0)
+        try:
+            with open(cap_path, 'rb') as f:
+                f.seek(start)
+                data = f.read()
+        except OSError:
+            return False
+        
+        pos = 0
+        if not start:
+            if len(data) < 24:
+                return False
+            if data[:4] in (b"\xd4\xc3\xb2\xa1", b"\x4d\x3c\xb2\xa1"):
+                state["endian"] = "<"
+            elif data[:4] in (b"\xa1\xb2\xc3\xd4", b"\xa1\xb2\x3c\x4d"):
+                state["endian"] = ">"
+            else:
+                state["endian"] = None  # not a pcap file (e.g. pcapng); never ends the capture early
+            state["linktype"] = struct.unpack_from(f"{state['endian'] or '<'}I", data, 20)[0]
+            state["stations"] = {}
+            pos = 24
+        if state["endian"] is None:
+            state["offset"] = start + len(data)
+            return False
+        
+        target = bytes.fromhex(bssid.replace(':', '').replace('-', '')) if bssid else None
+        stations = state["stations"]
+        record = struct.Struct(f"{state['endian']}4I")
+        # Stop at a record airodump-ng is still writing; it is read in full next time
+        while pos + 16 <= len(data):
+            incl_len = record.unpack_from(data, pos)[2]
+            if pos + 16 + incl_len > len(data):
+                break
+            message = _eapol_key_message(data[pos + 16:pos + 16 + incl_len], state["linktype"])
+            pos += 16 + incl_len
+            if message is None or message[2] == 4 or (target and message[0] != target):
+                continue
+            _, station, number, replay_counter = message
+            stations.setdefault(station, {1: set(), 2: set(), 3: set()})[number].add(replay_counter)
+        state["offset"] = start + pos
+        
+        return any(seen[1] & seen[2] or {counter - 1 for counter in seen[3]} & seen[2]
+                   for seen in stations.values())
+    
+    def _wait_for_bssid(self, csv_file, bssid, process, timeout):
+        """Wait until airodump-ng lists bssid in its CSV, it exits, or timeout seconds pass."""
+        # airodump-ng writes BSSIDs colon-separated; _validate_bssid also accepts dashes
+        target = bssid.replace('-', ':').upper().encode()
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and process.poll() is None:
+            try:
+                with open(csv_file, 'rb') as f:
+                    # AP rows come before the client table
+                    if target in f.read().partition(b"Station MAC")[0].upper():
+                        return True
+            except OSError:
+                pass
+            time.sleep(0.2)
+        return False
+    
+    def _convert_cap_to_22000(self, cap_file):
+        """Convert a capture to hashcat's 22000 format if hcxpcapngtool is installed."""
+        if not self._check_tool_exists("hcxpcapngtool"):
+            return None
+        
+        hash_file = cap_file.with_suffix(".22000")
+        try:
+            result = subprocess.run(["hcxpcapngtool", "-o", str(hash_file), str(cap_file)],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        
+        # hcxpcapngtool only writes the file when it found usable EAPOL/PMKID data
+        if result.returncode == 0 and hash_file.exists():
+            return hash_file
+        return None
+    
     def advanced_handshake_capture(self):
         """Advanced handshake capture with deauth attacks."""
         console.print("[bold red]🔐 Advanced Handshake Capture + Deauth[/bold red]")
@@ -1538,7 +2080,7 @@ class NetHawk:
         channel = Prompt.ask("Enter target channel", default="6")
         
         # Validate BSSID format
-        if bssid and not re.match(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$', bssid):
+        if bssid and not self._validate_bssid(bssid):
             console.print("[red]❌ Invalid BSSID format! Use format: XX:XX:XX:XX:XX:XX[/red]")
             return
         
@@ -1587,7 +2129,7 @@ class NetHawk:
             console.print(f"[yellow]⚠️ Using default: 60 seconds[/yellow]")
         
         # Start handshake capture
-        output_file = os.path.join(self.handshakes_path, f"{essid}_handshake_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        output_file = str(self.handshakes_path / f"{essid}_handshake_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
         
         try:
             console.print(f"\n[blue]🚀 Starting handshake capture...[/blue]")
@@ -1600,22 +2142,25 @@ class NetHawk:
                 "-w", output_file,
                 "--bssid", bssid,
                 "--output-format", "cap,csv",
+                # Refresh the CSV every second (default 5s) so the AP shows up in it promptly
+                "--write-interval", "1",
                 monitor_iface
             ]
             
             console.print(f"[blue]Running: {' '.join(cmd)}[/blue]")
-            airodump_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            airodump_process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
-            # Wait for airodump to start
+            # Deauth only once airodump-ng is on the channel and has seen the AP, for at most 3s
             console.print(f"[blue]⏳ Starting airodump-ng...[/blue]")
-            time.sleep(3)
+            if not self._wait_for_bssid(f"{output_file}-01.csv", bssid, airodump_process, timeout=3):
+                console.print(f"[yellow]⚠️ {bssid} not seen yet; continuing anyway[/yellow]")
             
             # Start deauth attack if requested
             deauth_process = None
             if use_deauth:
                 console.print(f"[red]🔥 Starting deauth attack with {deauth_count} packets...[/red]")
                 deauth_cmd = ["aireplay-ng", "--deauth", str(deauth_count), "-a", bssid, monitor_iface]
-                deauth_process = subprocess.Popen(deauth_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                deauth_process = subprocess.Popen(deauth_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 time.sleep(2)  # Let deauth complete
             
             # Show progress for handshake capture
@@ -1629,11 +2174,17 @@ class NetHawk:
             ) as progress:
                 task = progress.add_task("Capturing handshake...", total=capture_duration)
                 
+                # Stop early once one client's handshake messages pair up; otherwise run it out
+                cap_path = f"{output_file}-01.cap"
+                handshake_state = {}
                 for i in range(capture_duration):
-                    progress.update(task, description=f"Capturing... {i+1}/{capture_duration}s")
+                    progress.update(task, description=f"Capturing... {i+1}/{capture_duration}s", completed=i)
                     time.sleep(1)
-                
-                progress.update(task, description="Capture complete!")
+                    if self._handshake_captured(cap_path, bssid, handshake_state):
+                        progress.update(task, description="Handshake detected!", completed=capture_duration)
+                        break
+                else:
+                    progress.update(task, description="Capture complete!", completed=capture_duration)
             
             # Stop processes
             console.print(f"[blue]🛑 Stopping capture...[/blue]")
@@ -1645,15 +2196,27 @@ class NetHawk:
                 deauth_process.wait()
             
             # Check if handshake was captured
-            cap_file = f"{output_file}-01.cap"
-            if os.path.exists(cap_file):
-                file_size = os.path.getsize(cap_file)
+            cap_file = Path(f"{output_file}-01.cap")
+            try:
+                file_size = cap_file.stat().st_size  # One stat covers existence and size
+            except FileNotFoundError:
+                file_size = None
+            if file_size is not None:
                 console.print(f"\n[green]✅ Handshake capture completed![/green]")
                 console.print(f"[blue]📁 Files saved:[/blue]")
-                console.print(f"  • {os.path.basename(cap_file)} ({file_size} bytes)")
-                console.print(f"  • {os.path.basename(output_file)}-01.csv (Capture data)")
+                console.print(f"  • {cap_file.name} ({file_size} bytes)")
+                console.print(f"  • {cap_file.with_suffix('.csv').name} (Capture data)")
                 console.print(f"[yellow]💡 Use aircrack-ng to crack the handshake:[/yellow]")
                 console.print(f"[blue]aircrack-ng -w wordlist.txt {cap_file}[/blue]")
+                console.print(f"[yellow]💡 Several wordlists? Stream them into one run instead of restarting per list:[/yellow]")
+                console.print(f"[blue]cat list1.txt list2.txt | aircrack-ng -w - {cap_file}[/blue]")
+                
+                # Convert once up front so hashcat can crack on the GPU
+                hash_file = self._convert_cap_to_22000(cap_file)
+                if hash_file:
+                    console.print(f"  • {hash_file.name} (hashcat 22000 format)")
+                    console.print(f"[yellow]💡 Or crack on the GPU with hashcat:[/yellow]")
+                    console.print(f"[blue]hashcat -m 22000 -a 0 -w 3 {hash_file} wordlist.txt[/blue]")
             else:
                 console.print(f"[yellow]⚠️ No handshake captured. Try increasing duration or using deauth.[/yellow]")
             
@@ -1684,6 +2247,46 @@ class NetHawk:
             console.print(f"[blue]🔄 Restoring managed mode...[/blue]")
             self._restore_managed_mode(monitor_iface)
     
+    def _run_with_progress(self, cmd, label, timeout):
+        """Run a long external scan under a progress bar and return (returncode, stdout, stderr).
+        
+        The process is killed and subprocess.TimeoutExpired raised after timeout seconds.
+        """
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TimeElapsedColumn(),
+            console=console
+        ) as progress:
+            task = progress.add_task(label, total=timeout)
+            
+            # Raw bytes, decoded once at the end; scanner output is not always valid UTF-8
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            start = time.monotonic()
+            try:
+                while True:
+                    elapsed = time.monotonic() - start
+                    if elapsed >= timeout:
+                        process.kill()
+                        process.communicate()
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    try:
+                        # Returns as soon as the scan exits; keeps draining its pipes meanwhile
+                        stdout, stderr = process.communicate(timeout=min(2, timeout - elapsed))
+                        break
+                    except subprocess.TimeoutExpired:
+                        elapsed = int(time.monotonic() - start)
+                        progress.update(task, description=f"{label} {elapsed}/{timeout}s", completed=elapsed)
+            except BaseException:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                raise
+            
+            progress.update(task, description="Scan completed!", completed=timeout)
+        return process.returncode, stdout.decode("utf-8", "replace"), stderr.decode("utf-8", "replace")
+    
     def vulnerability_assessment(self):
         """Simple vulnerability assessment using nmap."""
         console.print("[bold red]🔍 Vulnerability Assessment[/bold red]")
@@ -1743,33 +2346,10 @@ class NetHawk:
         
         try:
             # Run vulnerability scan with progress
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TimeElapsedColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task(f"Scanning {target}...", total=timeout)
-                
-                # Start the scan
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                
-                # Show progress
-                for i in range(timeout):
-                    progress.update(task, description=f"Scanning {target}... {i+1}/{timeout}s")
-                    time.sleep(1)
-                    
-                    # Check if process finished
-                    if process.poll() is not None:
-                        progress.update(task, description="Scan completed!")
-                        break
-                
-                # Get results
-                stdout, stderr = process.communicate()
+            returncode, stdout, stderr = self._run_with_progress(cmd, f"Scanning {target}...", timeout)
             
             # Parse and display results
-            if process.returncode == 0:
+            if returncode == 0:
                 console.print(f"\n[green]✅ Vulnerability scan completed![/green]")
                 
                 # Parse vulnerabilities
@@ -1802,7 +2382,7 @@ class NetHawk:
                 # Show raw output for reference
                 if stdout:
                     console.print(f"\n[bold cyan]📋 Raw Scan Output:[/bold cyan]")
-                    console.print(f"[dim]{stdout[:1000]}{'...' if len(stdout) > 1000 else ''}[/dim]")
+                    console.print(self._raw_output_text(stdout, 1000))
                 
             else:
                 console.print(f"[red]❌ Vulnerability scan failed![/red]")
@@ -1842,22 +2422,12 @@ class NetHawk:
                 
                 # Try to extract CVE if present
                 if 'CVE-' in title:
-                    cve_match = re.search(r'CVE-\d{4}-\d+', title)
+                    cve_match = _CVE_RE.search(title)
                     if cve_match:
                         current_vuln["cve"] = cve_match.group()
                 
                 # Determine severity based on keywords
-                title_lower = title.lower()
-                if any(word in title_lower for word in ['critical', 'remote code execution', 'rce']):
-                    current_vuln["severity"] = "Critical"
-                elif any(word in title_lower for word in ['high', 'buffer overflow', 'sql injection']):
-                    current_vuln["severity"] = "High"
-                elif any(word in title_lower for word in ['medium', 'information disclosure']):
-                    current_vuln["severity"] = "Medium"
-                elif any(word in title_lower for word in ['low', 'info']):
-                    current_vuln["severity"] = "Low"
-                else:
-                    current_vuln["severity"] = "Unknown"
+                current_vuln["severity"] = _classify_severity(title, _NMAP_SEVERITY_PATTERNS)
                     
             elif current_vuln and line and not line.startswith('|') and not line.startswith('+'):
                 # Add to description
@@ -1868,20 +2438,39 @@ class NetHawk:
         
         return vulnerabilities
     
+    def _raw_output_text(self, output, limit):
+        """Truncate raw tool output into a dim Text, so brackets in it are not read as markup."""
+        return Text(output[:limit] + ('...' if len(output) > limit else ''), style="dim")
+    
+    def _write_json(self, output_file, data):
+        """Write results as indented JSON, using orjson when it is installed."""
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(data, f, indent=2)
+    
+    def _read_json(self, input_file):
+        """Load a saved JSON result file, using orjson when it is installed."""
+        with open(input_file, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
     def _save_vulnerability_results(self, vulnerabilities, target):
         """Save vulnerability results to JSON file."""
+        now = datetime.now()
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "target": target,
             "vulnerabilities": vulnerabilities,
             "total_count": len(vulnerabilities)
         }
         
-        output_file = os.path.join(self.vulns_path, f"vulnerabilities_{target.replace('/', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        output_file = self.vulns_path / f"vulnerabilities_{target.replace('/', '_')}_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            self._write_json(output_file, results)
             console.print(f"[green]✅ Vulnerabilities saved to: {output_file}[/green]")
         except Exception as e:
             console.print(f"[yellow]⚠️ Could not save results: {e}[/yellow]")
@@ -1904,8 +2493,9 @@ class NetHawk:
     
     def _save_vulnerabilities(self, vulnerabilities, target):
         """Save vulnerabilities to JSON."""
+        now = datetime.now()
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "target": target,
             "vulnerabilities": vulnerabilities,
             "summary": {
@@ -1913,10 +2503,9 @@ class NetHawk:
             }
         }
         
-        output_file = os.path.join(self.vulns_path, f"vulnerabilities_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        output_file = self.vulns_path / f"vulnerabilities_{now.strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            self._write_json(output_file, results)
             console.print(f"[green]✓ Vulnerabilities saved to: {output_file}[/green]")
             
             # Show session storage message
@@ -1924,7 +2513,7 @@ class NetHawk:
             console.print(f"[blue]Session Path: {self.session_path}[/blue]")
             console.print(f"[blue]Vulnerabilities Directory: {self.vulns_path}[/blue]")
             console.print(f"[yellow]Files created:[/yellow]")
-            console.print(f"[blue]  - {os.path.basename(output_file)} (Vulnerability assessment)[/blue]")
+            console.print(f"[blue]  - {output_file.name} (Vulnerability assessment)[/blue]")
             console.print(f"[green]✓ All scan data is automatically saved to your session![/green]")
         except Exception as e:
             console.print(f"[red]Error saving vulnerabilities: {e}[/red]")
@@ -1983,30 +2572,7 @@ class NetHawk:
         
         try:
             # Run nikto scan with progress
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TimeElapsedColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task(f"Scanning {target_url}...", total=timeout)
-                
-                # Start the scan
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                
-                # Show progress
-                for i in range(timeout):
-                    progress.update(task, description=f"Scanning {target_url}... {i+1}/{timeout}s")
-                    time.sleep(1)
-                    
-                    # Check if process finished
-                    if process.poll() is not None:
-                        progress.update(task, description="Scan completed!")
-                        break
-                
-                # Get results
-                stdout, stderr = process.communicate()
+            returncode, stdout, stderr = self._run_with_progress(cmd, f"Scanning {target_url}...", timeout)
             
             # Parse and display results
             # Check if we got any useful output even if returncode != 0
@@ -2043,7 +2609,7 @@ class NetHawk:
                 # Show raw output for reference
                 if stdout:
                     console.print(f"\n[bold cyan]📋 Raw Scan Output:[/bold cyan]")
-                    console.print(f"[dim]{stdout[:1000]}{'...' if len(stdout) > 1000 else ''}[/dim]")
+                    console.print(self._raw_output_text(stdout, 1000))
                 
             else:
                 console.print(f"[red]❌ Web application scan failed![/red]")
@@ -2079,7 +2645,7 @@ class NetHawk:
             line = line.strip()
             
             # Look for vulnerability markers in nikto output
-            if '+ OSVDB-' in line or ('+ ' in line and ('vulnerable' in line.lower() or 'risk' in line.lower() or 'header' in line.lower() or 'directory' in line.lower() or 'file' in line.lower())):
+            if '+ OSVDB-' in line or ('+ ' in line and _NIKTO_FINDING_RE.search(line)):
                 if current_vuln:
                     vulnerabilities.append(current_vuln)
                 
@@ -2098,22 +2664,12 @@ class NetHawk:
                 
                 # Try to extract CVE if present
                 if 'CVE-' in title:
-                    cve_match = re.search(r'CVE-\d{4}-\d+', title)
+                    cve_match = _CVE_RE.search(title)
                     if cve_match:
                         current_vuln["cve"] = cve_match.group()
                 
                 # Determine severity based on keywords
-                title_lower = title.lower()
-                if any(word in title_lower for word in ['critical', 'remote code execution', 'rce', 'sql injection', 'buffer overflow']):
-                    current_vuln["severity"] = "Critical"
-                elif any(word in title_lower for word in ['high', 'xss', 'cross-site', 'directory traversal', 'file upload']):
-                    current_vuln["severity"] = "High"
-                elif any(word in title_lower for word in ['medium', 'information disclosure', 'header', 'version disclosure']):
-                    current_vuln["severity"] = "Medium"
-                elif any(word in title_lower for word in ['low', 'info', 'default', 'directory', 'file']):
-                    current_vuln["severity"] = "Low"
-                else:
-                    current_vuln["severity"] = "Unknown"
+                current_vuln["severity"] = _classify_severity(title, _NIKTO_SEVERITY_PATTERNS)
                     
             elif current_vuln and line and not line.startswith('+') and not line.startswith('-') and not line.startswith('|'):
                 # Add to description
@@ -2126,8 +2682,9 @@ class NetHawk:
     
     def _save_web_scan_results(self, vulnerabilities, target_url):
         """Save web scan results to JSON file."""
+        now = datetime.now()
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "target": target_url,
             "vulnerabilities": vulnerabilities,
             "total_count": len(vulnerabilities)
@@ -2135,11 +2692,10 @@ class NetHawk:
         
         # Create safe filename from URL
         safe_url = target_url.replace('http://', '').replace('https://', '').replace('/', '_').replace(':', '_')
-        output_file = os.path.join(self.vulns_path, f"web_scan_{safe_url}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        output_file = self.vulns_path / f"web_scan_{safe_url}_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            self._write_json(output_file, results)
             console.print(f"[green]✅ Web scan results saved to: {output_file}[/green]")
         except Exception as e:
             console.print(f"[yellow]⚠️ Could not save results: {e}[/yellow]")
@@ -2200,30 +2756,7 @@ class NetHawk:
         
         try:
             # Run enum4linux with progress
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TimeElapsedColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task(f"Enumerating {target}...", total=timeout)
-                
-                # Start the scan
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                
-                # Show progress
-                for i in range(timeout):
-                    progress.update(task, description=f"Enumerating {target}... {i+1}/{timeout}s")
-                    time.sleep(1)
-                    
-                    # Check if process finished
-                    if process.poll() is not None:
-                        progress.update(task, description="Scan completed!")
-                        break
-                
-                # Get results
-                stdout, stderr = process.communicate()
+            returncode, stdout, stderr = self._run_with_progress(cmd, f"Enumerating {target}...", timeout)
             
             # Parse and display results
             # Check if we got any useful output even if returncode != 0
@@ -2258,7 +2791,7 @@ class NetHawk:
                 # Show raw output for reference
                 if stdout:
                     console.print(f"\n[bold cyan]📋 Raw Scan Output:[/bold cyan]")
-                    console.print(f"[dim]{stdout[:1000]}{'...' if len(stdout) > 1000 else ''}[/dim]")
+                    console.print(self._raw_output_text(stdout, 1000))
                 
             else:
                 console.print(f"[red]❌ SMB enumeration failed![/red]")
@@ -2388,29 +2921,105 @@ class NetHawk:
     
     def _save_smb_results(self, smb_info, target):
         """Save SMB enumeration results to JSON file."""
+        now = datetime.now()
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "target": target,
             "smb_info": smb_info,
             "total_count": len(smb_info)
         }
         
-        output_file = os.path.join(self.vulns_path, f"smb_enum_{target}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        output_file = self.vulns_path / f"smb_enum_{target}_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            self._write_json(output_file, results)
             console.print(f"[green]✅ SMB enumeration results saved to: {output_file}[/green]")
         except Exception as e:
             console.print(f"[yellow]⚠️ Could not save results: {e}[/yellow]")
     
+    def _resolve_dns_queries(self, queries):
+        """Resolve (record type, dig arguments) queries in-process with dnspython, concurrently.
+        
+        Answers are rendered as a dig-style ANSWER SECTION so _parse_dns_results and the raw
+        output display work the same as with _run_dig_queries.
+        """
+        resolver = dns.resolver.Resolver()
+        resolver.lifetime = 5
+        
+        def resolve(query_type, args):
+            try:
+                if args[0] == "-x":
+                    answer = resolver.resolve(dns.reversename.from_address(args[1]), "PTR",
+                                              raise_on_no_answer=False)
+                elif args[1] == "ANY":
+                    # Resolver.resolve refuses metaqueries, so ANY is sent to the nameserver directly
+                    response, _ = dns.query.udp_with_fallback(
+                        dns.message.make_query(args[0], "ANY"), resolver.nameservers[0],
+                        timeout=resolver.lifetime, port=resolver.port
+                    )
+                    records = "\n".join(rrset.to_text() for rrset in response.answer)
+                    return f";; ANSWER SECTION:\n{records}\n"
+                else:
+                    answer = resolver.resolve(args[0], args[1], raise_on_no_answer=False)
+            except dns.exception.Timeout:
+                return "Timeout: Query took too long"
+            except Exception as e:
+                return f"Error: {str(e)}"
+            records = answer.rrset.to_text() if answer.rrset is not None else ""
+            return f";; ANSWER SECTION:\n{records}\n"
+        
+        results = dict.fromkeys(query_type for query_type, _ in queries)
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {executor.submit(resolve, query_type, args): query_type for query_type, args in queries}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+    
+    def _run_dig_queries(self, queries, timeout):
+        """Run every (record type, dig arguments) query in a single dig process.
+        
+        Returns {record type: dig output for that query, or an error string}, in query order.
+        """
+        # Bound each try so an unresponsive resolver cannot hold a query for dig's default 15s
+        cmd = ["dig", "+time=5", "+tries=1"]
+        for _, args in queries:
+            cmd.extend(args)
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return {query_type: "Timeout: Query took too long" for query_type, _ in queries}
+        except Exception as e:
+            return {query_type: f"Error: {str(e)}" for query_type, _ in queries}
+        
+        if result.returncode != 0:
+            # dig exits non-zero on a rejected argument or when no server replied; keep any
+            # answers it did print, and report why the rest are missing
+            reason = (result.stderr or result.stdout).strip() or "No response"
+            error = f"Error: dig exited with status {result.returncode}: {reason}"
+        else:
+            error = "Error: No response"
+        
+        # Each response starts with ";; Got answer:"; match it to its query by the question's type
+        answers = {}
+        for block in result.stdout.split(";; Got answer:")[1:]:
+            question = _DIG_QUESTION_RE.search(block)
+            if question:
+                answers.setdefault(question.group(1).upper(), ";; Got answer:" + block)
+        return {query_type: answers.get(query_type, error) for query_type, _ in queries}
+    
+    def _run_dns_queries(self, queries, timeout):
+        """Run queries with dnspython when it is installed, otherwise with a single dig process."""
+        if dns is not None:
+            return self._resolve_dns_queries(queries)
+        return self._run_dig_queries(queries, timeout)
+    
     def dns_reconnaissance(self):
         """Simple DNS reconnaissance using dig and nslookup."""
         console.print("[bold red]🌐 DNS Reconnaissance[/bold red]")
         console.print("=" * 50)
         
-        # Check if dig is available
-        if not self.tools_available.get("dig", False):
+        # Check if dig is available (not needed when dnspython can resolve in-process)
+        if dns is None and not self.tools_available.get("dig", False):
             console.print("[red]❌ dig not found! Please install dnsutils.[/red]")
             console.print("[blue]Install: sudo apt install dnsutils[/blue]")
             return
@@ -2438,36 +3047,43 @@ class NetHawk:
             ["1", "2", "3"]
         )
         
-        # Build DNS queries based on scan type
+        # Build DNS queries based on scan type: (record type, dig query arguments)
+        reverse_lookup = False
         if scan_type == "1":  # Quick
             queries = [
-                ("A", f"dig {domain} A"),
-                ("MX", f"dig {domain} MX"),
-                ("NS", f"dig {domain} NS")
+                ("A", [domain, "A"]),
+                ("MX", [domain, "MX"]),
+                ("NS", [domain, "NS"])
             ]
             scan_name = "Quick DNS Reconnaissance"
             timeout = 60  # 1 minute
         elif scan_type == "2":  # Standard
             queries = [
-                ("A", f"dig {domain} A"),
-                ("MX", f"dig {domain} MX"),
-                ("NS", f"dig {domain} NS"),
-                ("TXT", f"dig {domain} TXT"),
-                ("CNAME", f"dig www.{domain} CNAME")
+                ("A", [domain, "A"]),
+                ("MX", [domain, "MX"]),
+                ("NS", [domain, "NS"]),
+                ("TXT", [domain, "TXT"]),
+                ("CNAME", [f"www.{domain}", "CNAME"])
             ]
             scan_name = "Standard DNS Reconnaissance"
             timeout = 120  # 2 minutes
         else:  # Comprehensive
             queries = [
-                ("A", f"dig {domain} A"),
-                ("MX", f"dig {domain} MX"),
-                ("NS", f"dig {domain} NS"),
-                ("TXT", f"dig {domain} TXT"),
-                ("CNAME", f"dig www.{domain} CNAME"),
-                ("SOA", f"dig {domain} SOA"),
-                ("PTR", f"dig -x {domain}"),
-                ("ANY", f"dig {domain} ANY")
+                ("A", [domain, "A"]),
+                ("MX", [domain, "MX"]),
+                ("NS", [domain, "NS"]),
+                ("TXT", [domain, "TXT"]),
+                ("CNAME", [f"www.{domain}", "CNAME"]),
+                ("SOA", [domain, "SOA"]),
+                ("ANY", [domain, "ANY"])
             ]
+            # dig -x rejects a hostname, which would fail every query in the shared dig run;
+            # hostnames get their reverse lookup on the resolved A record afterwards
+            try:
+                ipaddress.ip_address(domain)
+                queries.append(("PTR", ["-x", domain]))
+            except ValueError:
+                reverse_lookup = True
             scan_name = "Comprehensive DNS Reconnaissance"
             timeout = 180  # 3 minutes
         
@@ -2488,21 +3104,14 @@ class NetHawk:
             ) as progress:
                 task = progress.add_task(f"Querying {domain}...", total=len(queries))
                 
-                for query_type, cmd in queries:
-                    progress.update(task, description=f"Querying {query_type} records for {domain}...")
-                    
-                    try:
-                        result = subprocess.run(cmd.split(), capture_output=True, text=True, timeout=30)
-                        if result.returncode == 0:
-                            dns_results[query_type] = result.stdout
-                        else:
-                            dns_results[query_type] = f"Error: {result.stderr}"
-                    except subprocess.TimeoutExpired:
-                        dns_results[query_type] = "Timeout: Query took too long"
-                    except Exception as e:
-                        dns_results[query_type] = f"Error: {str(e)}"
-                    
-                    progress.advance(task)
+                dns_results = self._run_dns_queries(queries, timeout)
+                progress.advance(task, len(queries))
+                
+                if reverse_lookup:
+                    address = _DIG_A_RECORD_RE.search(dns_results.get("A", ""))
+                    if address:
+                        progress.update(task, description=f"Reverse lookup of {address.group(1)}...")
+                        dns_results.update(self._run_dns_queries([("PTR", ["-x", address.group(1)])], timeout))
             
             # Parse and display results
             console.print(f"\n[green]✅ DNS reconnaissance completed![/green]")
@@ -2534,10 +3143,13 @@ class NetHawk:
             
             # Show raw output for reference
             console.print(f"\n[bold cyan]📋 Raw DNS Output:[/bold cyan]")
+            raw_parts = []
             for query_type, result in dns_results.items():
                 if result and "Error:" not in result and "Timeout:" not in result:
-                    console.print(f"\n[bold]{query_type} Records:[/bold]")
-                    console.print(f"[dim]{result[:500]}{'...' if len(result) > 500 else ''}[/dim]")
+                    raw_parts.append(Text(f"\n{query_type} Records:", style="bold"))
+                    raw_parts.append(self._raw_output_text(result, 500))
+            if raw_parts:
+                console.print(Text("\n").join(raw_parts))
                 
         except Exception as e:
             console.print(f"[red]❌ Error during DNS reconnaissance: {e}[/red]")
@@ -2546,9 +3158,6 @@ class NetHawk:
     
     def _parse_dns_results(self, dns_results, domain):
         """Parse DNS query results to extract useful information with robust parsing."""
-        import re
-        import ipaddress
-        
         dns_info = []
         # Known DNS record types
         record_types = {"A", "AAAA", "MX", "NS", "TXT", "CNAME", "SOA", "PTR"}
@@ -2684,8 +3293,9 @@ class NetHawk:
     
     def _save_dns_results(self, dns_info, domain):
         """Save DNS reconnaissance results to JSON file."""
+        now = datetime.now()
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "target": domain,
             "dns_info": dns_info,
             "total_count": len(dns_info)
@@ -2693,11 +3303,10 @@ class NetHawk:
         
         # Create safe filename from domain
         safe_domain = domain.replace('.', '_').replace('/', '_')
-        output_file = os.path.join(self.vulns_path, f"dns_recon_{safe_domain}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        output_file = self.vulns_path / f"dns_recon_{safe_domain}_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            self._write_json(output_file, results)
             console.print(f"[green]✅ DNS reconnaissance results saved to: {output_file}[/green]")
         except Exception as e:
             console.print(f"[yellow]⚠️ Could not save results: {e}[/yellow]")
@@ -2719,120 +3328,114 @@ class NetHawk:
         
         try:
             # Create report file
-            report_file = os.path.join(self.session_path, f"comprehensive_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+            now = datetime.now()
+            generated = now.strftime('%Y-%m-%d %H:%M:%S')
+            report_file = self.session_path / f"comprehensive_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+            
+            # Build the report in memory and write it out in one call
+            parts = []
+            # Header
+            parts.append("=" * 80 + "\n")
+            parts.append("NetHawk v3.0 - Comprehensive Security Assessment Report\n")
+            parts.append("=" * 80 + "\n")
+            parts.append(f"Generated: {generated}\n")
+            parts.append(f"Session: {self.session_path}\n")
+            parts.append(f"Report Type: {'Summary' if report_type == '1' else 'Detailed' if report_type == '2' else 'Full'}\n\n")
+            
+            # Executive Summary
+            parts.append("EXECUTIVE SUMMARY\n")
+            parts.append("-" * 40 + "\n")
+            parts.append("This report contains the results of comprehensive network security assessment\n")
+            parts.append("performed using NetHawk v3.0 - Professional penetration testing tool.\n\n")
+            
+            # Session Information
+            parts.append("SESSION INFORMATION\n")
+            parts.append("-" * 40 + "\n")
+            parts.append(f"Session Number: {self.session_number}\n")
+            parts.append(f"Session Path: {self.session_path}\n")
+            parts.append(f"Report Generated: {generated}\n")
+            parts.append(f"Python Version: {sys.version.split()[0]}\n")
+            parts.append(f"Platform: {sys.platform}\n\n")
+            
+            # Available Tools
+            parts.append("AVAILABLE TOOLS\n")
+            parts.append("-" * 40 + "\n")
+            available_tools = [k for k, v in self.tools_available.items() if v]
+            parts.append(f"Tools Available: {', '.join(available_tools) if available_tools else 'None'}\n")
+            parts.append(f"Total Tools: {len(available_tools)}/{len(self.tools_available)}\n\n")
+            
+            # Captured Handshakes
+            parts.append("CAPTURED HANDSHAKES\n")
+            parts.append("-" * 40 + "\n")
+            cap_files = self._session_files(self.handshakes_path, ".cap")
+            if cap_files:
+                parts.append(f"Total Handshakes Captured: {len(cap_files)}\n")
+                for cap_entry in cap_files:
+                    file_size = cap_entry.stat().st_size
+                    parts.append(f"  • {cap_entry.name} ({file_size} bytes)\n")
+                    parts.append(f"    Status: Captured - ready for external cracking\n")
+            else:
+                parts.append("No handshake files captured.\n")
+            parts.append("\n")
+            
+            # Vulnerability Reports
+            parts.append("VULNERABILITY REPORTS\n")
+            parts.append("-" * 40 + "\n")
+            vuln_files = self._session_files(self.vulns_path, ".json")
+            if vuln_files:
+                parts.append(f"Total Vulnerability Reports: {len(vuln_files)}\n")
+                for vuln_entry in vuln_files:
+                    parts.append(f"  • {vuln_entry.name}\n")
+                    # Try to parse and show summary
+                    try:
+                        vuln_data = self._read_json(vuln_entry.path)
+                        if 'total_count' in vuln_data:
+                            parts.append(f"    Vulnerabilities Found: {vuln_data['total_count']}\n")
+                        if 'target' in vuln_data:
+                            parts.append(f"    Target: {vuln_data['target']}\n")
+                    except:
+                        pass
+            else:
+                parts.append("No vulnerability reports generated.\n")
+            parts.append("\n")
+            
+            # Session Statistics
+            parts.append("SESSION STATISTICS\n")
+            parts.append("-" * 40 + "\n")
+            parts.append(f"Handshakes Directory: {self.handshakes_path}\n")
+            parts.append(f"Vulnerabilities Directory: {self.vulns_path}\n")
+            parts.append(f"Logs Directory: {self.logs_path}\n")
+            parts.append(f"Reports Directory: {self.reports_path}\n\n")
+            
+            # File Counts
+            parts.append("FILE COUNTS\n")
+            parts.append("-" * 40 + "\n")
+            parts.append(f"Handshake Files: {len(cap_files)}\n")
+            parts.append(f"Vulnerability Reports: {len(vuln_files)}\n")
+            
+            # Count other files
+            parts.append(f"Log Files: {len(self._session_files(self.logs_path, '.jsonl'))}\n")
+            parts.append(f"Report Files: {len(self._session_files(self.reports_path, '.txt'))}\n")
+            
+            parts.append("\n")
+            
+            # Recommendations
+            parts.append("RECOMMENDATIONS\n")
+            parts.append("-" * 40 + "\n")
+            parts.append("1. Review all captured handshakes for potential security issues\n")
+            parts.append("2. Analyze vulnerability reports for remediation steps\n")
+            parts.append("3. Use external tools (aircrack-ng, hashcat) for handshake cracking\n")
+            parts.append("4. Implement security measures based on findings\n")
+            parts.append("5. Regular security assessments recommended\n\n")
+            
+            # Footer
+            parts.append("=" * 80 + "\n")
+            parts.append("Report generated by NetHawk v3.0\n")
+            parts.append("For security purposes only - use responsibly\n")
+            parts.append("=" * 80 + "\n")
             
             with open(report_file, 'w') as f:
-                # Header
-                f.write("=" * 80 + "\n")
-                f.write("NetHawk v3.0 - Comprehensive Security Assessment Report\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Session: {self.session_path}\n")
-                f.write(f"Report Type: {'Summary' if report_type == '1' else 'Detailed' if report_type == '2' else 'Full'}\n\n")
-                
-                # Executive Summary
-                f.write("EXECUTIVE SUMMARY\n")
-                f.write("-" * 40 + "\n")
-                f.write("This report contains the results of comprehensive network security assessment\n")
-                f.write("performed using NetHawk v3.0 - Professional penetration testing tool.\n\n")
-                
-                # Session Information
-                f.write("SESSION INFORMATION\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Session Number: {self.session_number}\n")
-                f.write(f"Session Path: {self.session_path}\n")
-                f.write(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Python Version: {sys.version.split()[0]}\n")
-                f.write(f"Platform: {sys.platform}\n\n")
-                
-                # Available Tools
-                f.write("AVAILABLE TOOLS\n")
-                f.write("-" * 40 + "\n")
-                available_tools = [k for k, v in self.tools_available.items() if v]
-                f.write(f"Tools Available: {', '.join(available_tools) if available_tools else 'None'}\n")
-                f.write(f"Total Tools: {len(available_tools)}/{len(self.tools_available)}\n\n")
-                
-                # Captured Handshakes
-                f.write("CAPTURED HANDSHAKES\n")
-                f.write("-" * 40 + "\n")
-                cap_files = [f for f in os.listdir(self.handshakes_path) if f.endswith('.cap')]
-                if cap_files:
-                    f.write(f"Total Handshakes Captured: {len(cap_files)}\n")
-                    for cap_file in cap_files:
-                        cap_path = os.path.join(self.handshakes_path, cap_file)
-                        file_size = os.path.getsize(cap_path)
-                        f.write(f"  • {cap_file} ({file_size} bytes)\n")
-                        f.write(f"    Status: Captured - ready for external cracking\n")
-                else:
-                    f.write("No handshake files captured.\n")
-                f.write("\n")
-                
-                # Vulnerability Reports
-                f.write("VULNERABILITY REPORTS\n")
-                f.write("-" * 40 + "\n")
-                vuln_files = [f for f in os.listdir(self.vulns_path) if f.endswith('.json')]
-                if vuln_files:
-                    f.write(f"Total Vulnerability Reports: {len(vuln_files)}\n")
-                    for vuln_file in vuln_files:
-                        f.write(f"  • {vuln_file}\n")
-                        # Try to parse and show summary
-                        try:
-                            vuln_path = os.path.join(self.vulns_path, vuln_file)
-                            with open(vuln_path, 'r') as vf:
-                                vuln_data = json.load(vf)
-                                if 'total_count' in vuln_data:
-                                    f.write(f"    Vulnerabilities Found: {vuln_data['total_count']}\n")
-                                if 'target' in vuln_data:
-                                    f.write(f"    Target: {vuln_data['target']}\n")
-                        except:
-                            pass
-                else:
-                    f.write("No vulnerability reports generated.\n")
-                f.write("\n")
-                
-                # Session Statistics
-                f.write("SESSION STATISTICS\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Handshakes Directory: {self.handshakes_path}\n")
-                f.write(f"Vulnerabilities Directory: {self.vulns_path}\n")
-                f.write(f"Logs Directory: {self.logs_path}\n")
-                f.write(f"Reports Directory: {self.reports_path}\n\n")
-                
-                # File Counts
-                f.write("FILE COUNTS\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Handshake Files: {len(cap_files)}\n")
-                f.write(f"Vulnerability Reports: {len(vuln_files)}\n")
-                
-                # Count other files
-                try:
-                    log_files = [f for f in os.listdir(self.logs_path) if f.endswith('.jsonl')]
-                    f.write(f"Log Files: {len(log_files)}\n")
-                except:
-                    f.write("Log Files: 0\n")
-                
-                try:
-                    report_files = [f for f in os.listdir(self.reports_path) if f.endswith('.txt')]
-                    f.write(f"Report Files: {len(report_files)}\n")
-                except:
-                    f.write("Report Files: 0\n")
-                
-                f.write("\n")
-                
-                # Recommendations
-                f.write("RECOMMENDATIONS\n")
-                f.write("-" * 40 + "\n")
-                f.write("1. Review all captured handshakes for potential security issues\n")
-                f.write("2. Analyze vulnerability reports for remediation steps\n")
-                f.write("3. Use external tools (aircrack-ng, hashcat) for handshake cracking\n")
-                f.write("4. Implement security measures based on findings\n")
-                f.write("5. Regular security assessments recommended\n\n")
-                
-                # Footer
-                f.write("=" * 80 + "\n")
-                f.write("Report generated by NetHawk v3.0\n")
-                f.write("For security purposes only - use responsibly\n")
-                f.write("=" * 80 + "\n")
+                f.write("".join(parts))
             
             # Display summary
             console.print(f"\n[green]✅ Comprehensive report generated![/green]")
@@ -2857,6 +3460,15 @@ class NetHawk:
         
         console.print(f"\n[yellow]Press Ctrl+C to stop[/yellow]")
     
+    def _session_files(self, directory, suffix):
+        """Return the files in a session directory ending in suffix, in name order, from one scandir pass."""
+        try:
+            with os.scandir(directory) as entries:
+                return sorted((entry for entry in entries if entry.name.endswith(suffix) and entry.is_file()),
+                              key=lambda entry: entry.name)
+        except OSError:
+            return []
+    
     def _load_config(self):
         """Load configuration (placeholder). Returns dict of defaults."""
         # TODO: read a JSON/YAML config file if you need persistent settings
@@ -2878,10 +3490,7 @@ class NetHawk:
             while True:
                 self.display_main_menu()
                 
-                choice = self.validate_input(
-                    "\nSelect an option: ", 
-                    ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0"]
-                )
+                choice = self.validate_input("\nSelect an option: ", _MENU_CHOICES)
                 
                 if choice == "1":
                     self.aggressive_passive_scan()
@@ -2930,109 +3539,233 @@ class NetHawk:
             # fallback to aggressive ping
             return self._aggressive_ping_host(ip)
 
-    def _scan_host_ports(self, ip, port_range="top1000", scan_type="aggressive"):
+    def _build_port_scan_cmd(self, targets, port_range="top1000", scan_type="aggressive"):
+        """Build the nmap port/service/OS scan command for one or more targets."""
+        cmd = ["nmap"]
+        # -Pn: skip host discovery (we already know host is up). This avoids false negatives.
+        # -sS: SYN scan (requires root) — faster and better for stealth.
+        # -sV: service/version detection
+        # -O: OS detection (requires root and packets to be allowed)
+        # --version-intensity 5: moderate version detection intensity
+        # -p: port range can be "1-65535" or "top1000"
+        cmd.extend(["-Pn", "-sS", "-sV", "-O", "--version-intensity", "5"])
+
+        # Port selection
+        if port_range == "all":
+            cmd.extend(["-p", "1-65535"])
+        elif port_range == "top1000":
+            cmd.extend(["--top-ports", "1000"])
+        else:
+            # If user passed e.g. "1-1000"
+            cmd.extend(["-p", str(port_range)])
+
+        # Add some timing option depending on scan_type
+        if scan_type == "fast":
+            cmd.extend(["-T4"])
+        elif scan_type == "aggressive":
+            cmd.extend(["-T4"])
+        else:  # comprehensive
+            cmd.extend(["-T3", "--max-retries", "2"])
+
+        # Let nmap scan up to 64 hosts side by side instead of ramping up from small groups
+        if len(targets) > 1:
+            cmd.extend(["--min-hostgroup", str(min(len(targets), 64))])
+
+        # XML on stdout: one <host> element per target, with service versions and OS matches
+        cmd.extend(["-oX", "-"])
+
+        cmd.extend(targets)
+        return cmd
+
+    def _parse_host_scan(self, ip, parsed):
+        """Turn a host's _parse_nmap_xml entry (or None if nmap did not report it) into a result dict."""
+        open_ports, os_info, raw = parsed or ([], "Unknown", "")
+        services = [port["service"] for port in open_ports]
+        return self._build_host_result(ip, open_ports, services, os_info, raw)
+
+    def _build_host_result(self, ip, open_ports, services, os_info, raw):
+        """Attach MAC/vendor and the inferred device type to a host's scan findings."""
+        # Try to get MAC/vendor (local ARP)
+        mac = self._get_mac_address(ip) if hasattr(self, "_get_mac_address") else "Unknown"
+        mac_vendor = self._get_mac_vendor(mac) if hasattr(self, "_get_mac_vendor") else None
+
+        # Infer device kind from ports/services/os/vendor using hybrid methodology
+        device_kind = self._infer_device_type(open_ports, services, os_info, mac_vendor, mac)
+
+        return {
+            "open_ports": open_ports,
+            "os": os_info or "Unknown",
+            "services": services,
+            "nmap_output": raw,
+            "mac": mac,
+            "mac_vendor": mac_vendor,
+            "device": device_kind
+        }
+
+    def _tcp_service_name(self, port):
+        """Best-effort service name for a TCP port from the system services database."""
+        name = NetHawk._tcp_service_names.get(port)
+        if name is None:
+            try:
+                name = socket.getservbyport(port, "tcp")
+            except OSError:
+                name = "unknown"
+            NetHawk._tcp_service_names[port] = name
+        return name
+
+    def _probe_batch(self, targets):
+        """Start non-blocking connects to every (ip, port) target and wait on them together.
+        
+        Connected sockets stay registered for up to _BANNER_GRAB_TIMEOUT more so services
+        that speak first (SSH, FTP, SMTP, ...) can send their banner.
+        Returns {target: banner} for targets that accepted within _CONNECT_SCAN_TIMEOUT.
         """
-        Perform a per-host nmap scan that tries to discover open ports, service versions, and OS.
-        Returns a dict: {"open_ports": [...], "os": "string or Unknown", "services": [...], "nmap_output": "raw"}
+        selector = selectors.DefaultSelector()
+        found = {}
+        connecting = 0
+        try:
+            for target in targets:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                err = sock.connect_ex(target)
+                if err == errno.EINPROGRESS:
+                    selector.register(sock, selectors.EVENT_WRITE, target)
+                    connecting += 1
+                elif err == 0:
+                    found[target] = ""
+                    selector.register(sock, selectors.EVENT_READ, target)
+                else:
+                    sock.close()
+            
+            connect_deadline = time.monotonic() + _CONNECT_SCAN_TIMEOUT
+            banner_deadline = connect_deadline + _BANNER_GRAB_TIMEOUT
+            while selector.get_map():
+                now = time.monotonic()
+                if connecting and now >= connect_deadline:
+                    # Give up on connects still pending; keep waiting on banners
+                    for key in list(selector.get_map().values()):
+                        if key.events == selectors.EVENT_WRITE:
+                            selector.unregister(key.fileobj)
+                            key.fileobj.close()
+                    connecting = 0
+                    continue
+                remaining = (connect_deadline if connecting else banner_deadline) - now
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    sock, target = key.fileobj, key.data
+                    if key.events == selectors.EVENT_WRITE:
+                        connecting -= 1
+                        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                            found[target] = ""
+                            selector.modify(sock, selectors.EVENT_READ, target)
+                            continue
+                    else:
+                        try:
+                            data = sock.recv(1024)
+                        except OSError:
+                            data = b""
+                        found[target] = data.decode("utf-8", "ignore").strip().split("\n", 1)[0].strip()
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+        return found
+
+    def _connect_scan(self, ips, ports=None):
         """
+        TCP connect scan of every (ip, port) pair using non-blocking sockets, in batches of
+        _CONNECT_SCAN_CONCURRENCY connects waited on through a single selector.
+        Returns a dict: {ip: [(port, banner), ...]} sorted by port.
+        """
+        ports = ports or _FALLBACK_SCAN_PORTS
+        targets = [(ip, port) for ip in ips for port in ports]
+        open_ports = {ip: [] for ip in ips}
+        for start in range(0, len(targets), _CONNECT_SCAN_CONCURRENCY):
+            for (ip, port), banner in self._probe_batch(targets[start:start + _CONNECT_SCAN_CONCURRENCY]).items():
+                open_ports[ip].append((port, banner))
+        return {ip: sorted(found) for ip, found in open_ports.items()}
+
+    def _batch_port_scan(self, ips, port_range="top1000", scan_type="aggressive", on_status=None):
+        """
+        Scan all hosts with a single nmap invocation instead of one process per host.
+        on_status, if given, is called with nmap's periodic progress line while it runs.
+        Returns a dict: {ip: result} with result as built by _build_host_result.
+        """
+        empty = {"open_ports": [], "os": "Unknown", "services": [], "nmap_output": ""}
         try:
             # Ensure nmap exists
-            if not shutil.which("nmap"):
+            if not self._check_tool_exists("nmap"):
                 console.print("[yellow]Warning: nmap not installed. Install nmap to get ports/OS detection.[/yellow]")
-                return {"open_ports": [], "os": "Unknown", "services": [], "nmap_output": ""}
-
-            # Build nmap command
-            cmd = ["nmap"]
-            # -Pn: skip host discovery (we already know host is up). This avoids false negatives.
-            # -sS: SYN scan (requires root) — faster and better for stealth.
-            # -sV: service/version detection
-            # -O: OS detection (requires root and packets to be allowed)
-            # --version-intensity 5: moderate version detection intensity
-            # -p: port range can be "1-65535" or "top1000"
-            cmd.extend(["-Pn", "-sS", "-sV", "-O", "--version-intensity", "5"])
-
-            # Port selection
-            if port_range == "all":
-                cmd.extend(["-p", "1-65535"])
-            elif port_range == "top1000":
-                cmd.extend(["--top-ports", "1000"])
-            else:
-                # If user passed e.g. "1-1000"
-                cmd.extend(["-p", str(port_range)])
+                console.print(f"[blue]Falling back to a TCP connect scan of {len(_FALLBACK_SCAN_PORTS)} common ports...[/blue]")
+                def fallback_result(ip, ports):
+                    open_ports = [{"port": str(port), "protocol": "tcp", "service": self._tcp_service_name(port), "banner": banner}
+                                  for port, banner in ports]
+                    services = [port["service"] for port in open_ports]
+                    return self._build_host_result(ip, open_ports, services, "Unknown", "")
+                return {ip: fallback_result(ip, ports) for ip, ports in self._connect_scan(ips).items()}
 
-            # Add some timing option depending on scan_type
-            if scan_type == "fast":
-                cmd.extend(["-T4"])
-            elif scan_type == "aggressive":
-                cmd.extend(["-T4"])
-            else:  # comprehensive
-                cmd.extend(["-T3", "--max-retries", "2"])
+            cmd = self._build_port_scan_cmd(ips, port_range, scan_type)
 
-            cmd.append(ip)
+            # One nmap run covers every host, so scale the timeout with the host count
+            console.print(f"[blue]Running nmap on {len(ips)} hosts (this may take a while)...[/blue]")
+            returncode, stdout, stderr = self._run_nmap_streaming(cmd, 600 * max(1, len(ips)), on_status)
 
-            # Run nmap (allow long timeout)
-            console.print(f"[blue]Running nmap on {ip} (this may take a few seconds)...[/blue]")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+            if returncode != 0 and stderr.strip():
+                console.print(f"[yellow]nmap: {stderr.strip()}[/yellow]")
+            parsed = self._parse_nmap_xml(stdout)
+            return {ip: self._parse_host_scan(ip, parsed.get(ip)) for ip in ips}
 
-            raw = result.stdout if result.returncode == 0 else result.stdout + "\n" + result.stderr
-
-            # Parse open ports / services
-            open_ports = []
-            services = []
+        except subprocess.TimeoutExpired as e:
+            # Keep every host nmap finished before it was killed; only the rest come back empty
+            parsed = self._parse_nmap_xml(e.output or "")
+            console.print(f"[yellow]Nmap timed out scanning {len(ips)} hosts "
+                          f"({len(parsed.keys() & set(ips))} completed)[/yellow]")
+            return {ip: self._parse_host_scan(ip, parsed[ip]) if ip in parsed else dict(empty) for ip in ips}
+        except Exception as e:
+            console.print(f"[red]Error scanning hosts: {e}[/red]")
+            return {ip: dict(empty) for ip in ips}
 
-            # lines like: "22/tcp   open  ssh     OpenSSH 7.9p1 Debian 10+deb10u2 (protocol 2.0)"
-            for line in raw.splitlines():
-                line = line.strip()
-                m = re.match(r"^(\d+)\/(tcp|udp)\s+open\s+([^\s]+)(\s+(.*))?$", line)
-                if m:
-                    portnum = m.group(1)
-                    proto = m.group(2)
-                    svc = m.group(3)
-                    svc_banner = m.group(5) or ""
-                    open_ports.append({"port": portnum, "protocol": proto, "service": svc, "banner": svc_banner})
-                    services.append(svc)
-
-            # Parse OS info: look for common markers
-            os_info = "Unknown"
-            # look for lines like "OS details: Linux 3.10 - 4.11"
-            m = re.search(r"OS details:\s*(.+)", raw)
-            if m:
-                os_info = m.group(1).strip()
-            else:
-                # nmap sometimes writes "OS guesses: Linux 3.2 - 4.9"
-                m2 = re.search(r"OS guesses:\s*(.+)", raw)
-                if m2:
-                    os_info = m2.group(1).strip()
-                else:
-                    # Device type sometimes on "Device type: general purpose"
-                    m3 = re.search(r"Device type:\s*(.+)", raw)
-                    if m3:
-                        os_info = m3.group(1).strip()
-
-            # Try to get MAC/vendor (local ARP)
-            mac = self._get_mac_address(ip) if hasattr(self, "_get_mac_address") else "Unknown"
-            mac_vendor = self._get_mac_vendor(mac) if hasattr(self, "_get_mac_vendor") else None
-
-            # Infer device kind from ports/services/os/vendor using hybrid methodology
-            device_kind = self._infer_device_type(open_ports, services, os_info, mac_vendor, mac)
-
-            return {
-                "open_ports": open_ports,
-                "os": os_info or "Unknown",
-                "services": services,
-                "nmap_output": raw,
-                "mac": mac,
-                "mac_vendor": mac_vendor,
-                "device": device_kind
-            }
+    def _run_nmap_streaming(self, cmd, timeout, on_status=None):
+        """Run nmap and read its output as it is produced.
+        
+        Adds --stats-every so nmap reports progress during long scans; those <taskprogress>
+        lines go to on_status instead of the returned output. Returns (returncode, stdout, stderr) and
+        raises subprocess.TimeoutExpired like subprocess.run, carrying the output read before the kill.
+        """
+        proc = subprocess.Popen(cmd + ["--stats-every", "2s"], stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True, errors="replace")
+        # Drain stderr alongside stdout so neither pipe can fill up and stall nmap
+        stderr_parts = []
+        stderr_reader = threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+        timed_out = []
+        timer = threading.Timer(timeout, lambda: (timed_out.append(True), proc.kill()))
+        timer.start()
+        
+        lines = []
+        try:
+            for line in proc.stdout:
+                stats = _NMAP_TASKPROGRESS_RE.search(line)
+                if stats:
+                    if on_status:
+                        on_status(f"{stats.group(1)}: about {stats.group(2)}% done")
+                    continue
+                lines.append(line)
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            stderr_reader.join()
+        
+        if timed_out:
+            raise subprocess.TimeoutExpired(cmd, timeout, output="".join(lines), stderr="".join(stderr_parts))
+        return proc.returncode, "".join(lines), "".join(stderr_parts)
 
-        except subprocess.TimeoutExpired:
-            console.print(f"[yellow]Nmap timed out scanning {ip}[/yellow]")
-            return {"open_ports": [], "os": "Unknown", "services": [], "nmap_output": ""}
-        except Exception as e:
-            console.print(f"[red]Error scanning {ip}: {e}[/red]")
-            return {"open_ports": [], "os": "Unknown", "services": [], "nmap_output": ""}
-    
 
 def main():
     """Main entry point."""
@@ -24,7 +24,7 @@ fi
 # Install system dependencies
 echo -e "${BLUE}📦 Installing NetHawk dependencies...${NC}"
 sudo apt update
-sudo apt install -y python3 python3-pip aircrack-ng iw iproute2 nmap masscan nikto gobuster enum4linux samba-client dnsutils
+sudo apt install -y python3 python3-pip aircrack-ng iw iproute2 nmap masscan nikto gobuster enum4linux samba-client dnsutils fping
 
 # Verify tools are available
 echo -e "${BLUE}🔍 Verifying NetHawk tools...${NC}"